@@ -0,0 +1,138 @@
+"""
+Runs the benchmark suite and compares the results against a stored baseline.
+
+Every benchmark reports the best time per operation in nanoseconds. The
+results are printed as JSON, or written to ``--output``. With ``--baseline``,
+the run fails with exit code 1 if any benchmark is more than ``--threshold``
+slower than the baseline.
+
+    python benchmarks/run.py --baseline benchmarks/baseline.json
+    python benchmarks/run.py --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Callable, Dict, Iterator, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from valley.tests.examples.example_schemas import Student, Troop, bruno, blitz, cocker  # noqa: E402
+from valley.utils.json_utils import ValleyDecoder, ValleyEncoder  # noqa: E402
+
+import schemas  # noqa: E402
+
+DEFAULT_THRESHOLD = 0.25
+
+STUDENT_VALID = dict(name='Frank White', slug='frank-white', email='frank@white.com', age=18, gpa=3.0,
+                     date='2017-01-10', datetime='2017-01-10T12:00:00', active=False)
+STUDENT_INVALID = dict(name='Ira', slug='frank white', email='frank', age=30, gpa=3.0,
+                       date='2017-13-10', datetime='yesterday', active='no')
+
+
+def _schema_benchmarks(name: str, schema_class: type, valid: dict, invalid: dict,
+                       to_json: bool = True) -> Iterator[Tuple[str, Callable[[], object]]]:
+    instance = schema_class(**valid)
+    invalid_instance = schema_class(**invalid)
+    keys = list(schema_class._base_properties)
+    encoded = json.dumps(instance, cls=ValleyEncoder)
+
+    def access() -> None:
+        for key in keys:
+            getattr(instance, key)
+
+    yield f'{name}.construct', lambda: schema_class(**valid)
+    yield f'{name}.validate_valid', instance.validate
+    yield f'{name}.validate_invalid', invalid_instance.validate
+    yield f'{name}.attribute_access', access
+    if to_json:
+        yield f'{name}.to_json', instance.to_json
+    yield f'{name}.decoder_roundtrip', lambda: json.loads(json.dumps(instance, cls=ValleyEncoder), cls=ValleyDecoder)
+    yield f'{name}.decode', lambda: json.loads(encoded, cls=ValleyDecoder)
+
+
+def benchmarks() -> Iterator[Tuple[str, Callable[[], object]]]:
+    """
+    Yields the name and function of every benchmark.
+    """
+    yield from _schema_benchmarks('Student', Student, STUDENT_VALID, STUDENT_INVALID)
+    # Foreign properties hold schema instances, which to_json() cannot serialize
+    yield from _schema_benchmarks('Troop', Troop, dict(name='Durham', dogs=[bruno, blitz], primary_breed=cocker),
+                                  dict(name=None, dogs=['Bruno'], primary_breed='Cocker'), to_json=False)
+    for count, schema_class in schemas.SYNTHETIC.items():
+        yield from _schema_benchmarks(f'Synthetic{count}', schema_class,
+                                      schemas.valid_row(count), schemas.invalid_row(count))
+
+
+def measure(fn: Callable[[], object], repeat: int) -> float:
+    """
+    Returns the best time per call of ``fn`` in nanoseconds.
+
+    Args:
+        fn (Callable[[], object]): The function to time.
+        repeat (int): The number of timed rounds of at least 0.2 seconds each.
+
+    Returns:
+        float: The time per call in nanoseconds.
+    """
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> Dict[str, float]:
+    """
+    Finds the benchmarks that are slower than the baseline by more than the threshold.
+
+    Args:
+        results (Dict[str, float]): The nanoseconds per operation of this run.
+        baseline (Dict[str, float]): The nanoseconds per operation of the baseline.
+        threshold (float): The allowed slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        Dict[str, float]: The ratio of this run to the baseline of every regressed benchmark.
+    """
+    regressions = {}
+    for name, nanoseconds in results.items():
+        expected = baseline.get(name)
+        if expected and nanoseconds / expected > 1 + threshold:
+            regressions[name] = round(nanoseconds / expected, 3)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', help='write the results to this file instead of stdout')
+    parser.add_argument('--baseline', help='fail if a benchmark regressed against this results file')
+    parser.add_argument('--save-baseline', help='write the results to this baseline file')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='the allowed slowdown against the baseline (default: %(default)s)')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    results = {name: round(measure(fn, args.repeat), 1) for name, fn in benchmarks() if args.filter in name}
+    report = {'python': platform.python_version(), 'unit': 'ns/op', 'results': results}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        report['threshold'] = args.threshold
+        report['regressions'] = compare(results, baseline, args.threshold)
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            f.write(json.dumps({'python': report['python'], 'unit': report['unit'], 'results': results},
+                               indent=2, sort_keys=True) + '\n')
+    return 1 if report.get('regressions') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""
+Synthetic schemas for the benchmark suite.
+
+``SYNTHETIC[n]`` is a schema class with ``n`` fields cycling through the common
+property types. The classes are module attributes, so ValleyDecoder can import
+them by name.
+"""
+import valley
+
+FIELD_COUNTS = (10, 100, 1000)
+
+_FIELDS = (
+    (lambda: valley.StringProperty(required=True, min_length=2, max_length=50), 'value', 'v' * 60),
+    (lambda: valley.IntegerProperty(min_value=0, max_value=1000), 42, 5000),
+    (lambda: valley.FloatProperty(), 1.5, 'x'),
+    (lambda: valley.EmailProperty(), 'frog@example.com', 'frog'),
+    (lambda: valley.BooleanProperty(), True, 'yes'),
+    (lambda: valley.DateProperty(), '2017-01-10', '2017-13-10'),
+    (lambda: valley.SlugProperty(max_length=30), 'some-slug', 'some slug'),
+)
+
+
+def _make_schema(field_count: int) -> type:
+    attrs = {'_create_error_dict': True, '__module__': __name__}
+    for index in range(field_count):
+        attrs[f'field_{index}'] = _FIELDS[index % len(_FIELDS)][0]()
+    return type(valley.Schema)(f'Synthetic{field_count}', (valley.Schema,), attrs)
+
+
+def valid_row(field_count: int) -> dict:
+    return {f'field_{index}': _FIELDS[index % len(_FIELDS)][1] for index in range(field_count)}
+
+
+def invalid_row(field_count: int) -> dict:
+    return {f'field_{index}': _FIELDS[index % len(_FIELDS)][2] for index in range(field_count)}
+
+
+SYNTHETIC = {}
+for _count in FIELD_COUNTS:
+    SYNTHETIC[_count] = globals()[f'Synthetic{_count}'] = _make_schema(_count)
@@ -0,0 +1,63 @@
+"""
+Measures the startup cost of an application with many schema classes.
+
+Every run happens in a fresh interpreter, which imports valley, creates
+``--classes`` schema classes of ``--fields`` properties each and validates
+``--validated`` of them. The median of ``--repeat`` runs is reported in
+milliseconds as JSON.
+
+    python benchmarks/startup.py --classes 1500 --fields 10
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+CHILD = '''
+import time
+start = time.perf_counter()
+import valley
+imported = time.perf_counter()
+classes = []
+for i in range({classes}):
+    attrs = {{f'field_{{j}}': valley.StringProperty(required=True, max_length=50) if j % 2 else
+              valley.IntegerProperty(min_value=0, max_value=1000) for j in range({fields})}}
+    classes.append(type(valley.Schema)(f'Schema{{i}}', (valley.Schema,), attrs))
+created = time.perf_counter()
+row = {{f'field_{{j}}': 'value' if j % 2 else j for j in range({fields})}}
+for schema_class in classes[:{validated}]:
+    schema_class(**row).validate()
+validated = time.perf_counter()
+print(imported - start, created - imported, validated - created)
+'''
+
+
+def run(classes: int, fields: int, validated: int) -> list:
+    code = CHILD.format(classes=classes, fields=fields, validated=validated)
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+    return [float(seconds) * 1000 for seconds in output.split()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--classes', type=int, default=1500)
+    parser.add_argument('--fields', type=int, default=10)
+    parser.add_argument('--validated', type=int, default=10, help='the number of classes validated once')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [run(args.classes, args.fields, args.validated) for _ in range(args.repeat)]
+    import_ms, create_ms, validate_ms = (statistics.median(column) for column in zip(*runs))
+    print(json.dumps({
+        'classes': args.classes,
+        'fields': args.fields,
+        'import_ms': round(import_ms, 2),
+        'class_creation_ms': round(create_ms, 2),
+        'first_validation_ms': round(validate_ms, 2),
+        'total_ms': round(import_ms + create_ms + validate_ms, 2),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,10 @@
 from .properties import *
-from .schema import Schema
\ No newline at end of file
+from .schema import Schema, SlottedSchema, depends_on
+
+
+def __getattr__(name):
+    # Opt-in submodules are only imported when they are first used, e.g. valley.instrument.enable()
+    if name == 'instrument':
+        import importlib
+        return importlib.import_module(f'valley.{name}')
+    raise AttributeError(f"module 'valley' has no attribute '{name}'")
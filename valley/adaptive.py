@@ -0,0 +1,104 @@
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from valley.exceptions import ErrorCode
+from valley.validators import Validator, as_check
+
+__all__ = ['AdaptiveChain']
+
+
+class AdaptiveChain:
+    """
+    Runs a sequence of reorderable validators in the order that rejects invalid values the cheapest.
+
+    Every ``sample_every``-th call is timed per validator, recording its cost and how often
+    it rejects values. Every ``reorder_every`` samples the validators are sorted by their
+    average cost divided by their rejection rate, so cheap validators that reject often run
+    first. Validators that have not been sampled yet are moved to the front to measure them.
+
+    Attributes:
+        validators (List[Validator]): The validators, in their declared order.
+        order (List[int]): The indices of the validators in the order they currently run in.
+    """
+
+    def __init__(self, validators: Sequence[Validator], name: str,
+                 sample_every: int = 16, reorder_every: int = 64) -> None:
+        self.validators: List[Validator] = list(validators)
+        self.order: List[int] = list(range(len(self.validators)))
+        self.sample_every = sample_every
+        self.reorder_every = reorder_every
+        self._functions = [as_check(validator, name) for validator in self.validators]
+        self._steps = tuple(self._functions)
+        self._calls = 0
+        self._samples = 0
+        self._attempts = [0] * len(self.validators)
+        self._failures = [0] * len(self.validators)
+        self._nanoseconds = [0] * len(self.validators)
+
+    def __call__(self, value: Any) -> Optional[ErrorCode]:
+        """
+        Checks the value with every validator of the chain.
+
+        Args:
+            value (Any): The value to be validated.
+
+        Returns:
+            Optional[ErrorCode]: The error of the first validator the value does not pass, or None.
+        """
+        self._calls += 1
+        if self._calls % self.sample_every == 0:
+            return self._sample(value)
+        for fn in self._steps:
+            error = fn(value)
+            if error is not None:
+                return error
+        return None
+
+    def _sample(self, value: Any) -> Optional[ErrorCode]:
+        functions = self._functions
+        error = None
+        for index in self.order:
+            self._attempts[index] += 1
+            start = time.perf_counter_ns()
+            error = functions[index](value)
+            self._nanoseconds[index] += time.perf_counter_ns() - start
+            if error is not None:
+                self._failures[index] += 1
+                break
+        self._samples += 1
+        if self._samples % self.reorder_every == 0:
+            self.reorder()
+        return error
+
+    def reorder(self) -> None:
+        """
+        Sorts the validators by their measured cost per rejection.
+        """
+        def rank(index: int) -> float:
+            attempts = self._attempts[index]
+            if not attempts:
+                return -1.0
+            cost = self._nanoseconds[index] / attempts
+            rejection_rate = self._failures[index] / attempts
+            return cost / max(rejection_rate, 1e-6)
+
+        self.order = sorted(self.order, key=rank)
+        self._steps = tuple(self._functions[index] for index in self.order)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Returns the sampled statistics per validator.
+
+        Returns:
+            List[Dict[str, Any]]: The validator class name, attempts, failures and average cost
+            in nanoseconds of every validator, in the current order.
+        """
+        return [
+            {
+                'validator': type(self.validators[index]).__name__,
+                'attempts': self._attempts[index],
+                'failures': self._failures[index],
+                'average_ns': self._nanoseconds[index] / self._attempts[index] if self._attempts[index] else 0.0,
+            }
+            for index in self.order
+        ]
@@ -0,0 +1,114 @@
+import array
+from collections.abc import Callable
+from typing import Any, Dict, List, Sequence, Type
+
+from valley.properties import BaseProperty
+from valley.validators import (
+    Validator, RequiredValidator, IntegerValidator, FloatValidator,
+    MinValueValidator, MaxValueValidator
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+__all__ = ['validate_column', 'validate_columns']
+
+# Validators that have a vectorized equivalent for numeric columns.
+VECTORIZED_VALIDATORS = (
+    RequiredValidator, IntegerValidator, FloatValidator,
+    MinValueValidator, MaxValueValidator
+)
+
+
+def validate_column(prop: BaseProperty, values: Sequence[Any], key: str = '') -> List[int]:
+    """
+    Validates a whole column of values against a property.
+
+    NumPy arrays and ``array.array`` columns of numeric values are checked with vectorized
+    comparisons when NumPy is installed and every validator of the property supports it.
+    Everything else falls back to checking one value at a time. In both cases a value
+    fails exactly when ``prop.validate(value, key)`` would fail for its Python equivalent.
+
+    Args:
+        prop (BaseProperty): The property to validate against.
+        values (Sequence[Any]): The column of values.
+        key (str, optional): The key associated with the property.
+
+    Returns:
+        List[int]: The indices of the values that failed validation, in ascending order.
+    """
+    arr = _as_numeric_array(values)
+    if arr is not None and _is_vectorizable(prop):
+        return _validate_array(prop, arr)
+
+    check = prop.compile_check(key)
+    failures = []
+    for index, value in enumerate(values):
+        if check(value) is not None:
+            failures.append(index)
+    return failures
+
+
+def validate_columns(schema_class: Type, columns: Dict[str, Sequence[Any]]) -> Dict[str, List[int]]:
+    """
+    Validates column-oriented data against the properties of a schema class.
+
+    Only the property constraints are checked; ``{key}_validate`` hooks need
+    an instance and are not run in column mode.
+
+    Args:
+        schema_class (Type): The Schema subclass.
+        columns (Dict[str, Sequence[Any]]): The columns keyed by property name.
+
+    Returns:
+        Dict[str, List[int]]: The failing row indices for every column that has failures.
+    """
+    failures = {}
+    for key, values in columns.items():
+        indices = validate_column(schema_class._base_properties[key], values, key)
+        if indices:
+            failures[key] = indices
+    return failures
+
+
+def _as_numeric_array(values: Any) -> Any:
+    if np is None or not isinstance(values, (np.ndarray, array.array)):
+        return None
+    arr = np.asarray(values)
+    if arr.ndim != 1 or arr.dtype.kind not in 'biuf':
+        return None
+    return arr
+
+
+def _is_vectorizable(prop: BaseProperty) -> bool:
+    if type(prop).validate is not BaseProperty.validate:
+        return False
+    if type(prop).get_default_value is not BaseProperty.get_default_value \
+            or isinstance(prop.default_value, Callable):
+        return False
+    if prop.default_value is not None and type(prop.default_value) not in (int, float):
+        return False
+    return all(type(validator) in VECTORIZED_VALIDATORS and type(validator).validate is Validator.validate
+               for validator in prop.validators)
+
+
+def _validate_array(prop: BaseProperty, arr: Any) -> List[int]:
+    default = prop.default_value
+    is_float = np.full(arr.shape, arr.dtype.kind == 'f')
+    if default is not None:
+        # Falsy values are replaced by the default before validation
+        is_default = arr == 0
+        arr = np.where(is_default, default, arr)
+        if isinstance(default, float):
+            is_float |= is_default
+    failed = np.zeros(arr.shape, dtype=bool)
+    for validator in prop.validators:
+        if isinstance(validator, IntegerValidator):
+            failed |= is_float
+        elif isinstance(validator, MinValueValidator):
+            failed |= arr < validator.min_value
+        elif isinstance(validator, MaxValueValidator):
+            failed |= arr > validator.max_value
+    return np.flatnonzero(failed).tolist()
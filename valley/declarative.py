@@ -1,4 +1,3 @@
-import collections
 from typing import Any, Dict, List, Type
 
 class DeclaredVars(object):
@@ -62,7 +61,7 @@ class DeclarativeVariablesMetaclass(type):
         return new_class
 
     @classmethod
-    def __prepare__(mcls, cls: str, bases: tuple) -> collections.OrderedDict:
+    def __prepare__(mcls, cls: str, bases: tuple) -> Dict[str, Any]:
         """
         Prepares the class namespace.
 
@@ -71,6 +70,6 @@ class DeclarativeVariablesMetaclass(type):
             bases (tuple): A tuple of base classes.
 
         Returns:
-            collections.OrderedDict: An ordered dictionary for the class namespace.
+            Dict[str, Any]: A plain dictionary for the class namespace, which preserves the declaration order.
         """
-        return collections.OrderedDict()
+        return {}
@@ -8,3 +8,99 @@ class ValidationException(Exception):
 
     def __str__(self):
         return self.error_msg
+
+
+class ErrorCode:
+    """
+    A validation error that is rendered into a message only when the message is needed.
+
+    Validators return error codes from Validator.check instead of raising
+    ValidationException. The same code object can be shared by every failure of a
+    validator, since the property name is only filled in by message().
+
+    Attributes:
+        code (str): A short identifier for the kind of error, e.g. 'max_length'.
+        template (str): The message template, formatted with ``name`` and ``params``.
+        params (Optional[dict]): The template parameters, or None if ``template`` is a finished message.
+        exception (Optional[ValidationException]): The exception the error was created from, if any.
+    """
+    __slots__ = ('code', 'template', 'params', 'exception')
+
+    def __init__(self, code, template, **params):
+        self.code = code
+        self.template = template
+        self.params = params
+        self.exception = None
+
+    @classmethod
+    def from_message(cls, msg, code='invalid'):
+        """
+        Creates an error code for a message that has already been rendered.
+
+        Args:
+            msg (str): The error message.
+            code (str, optional): The error code. Defaults to 'invalid'.
+
+        Returns:
+            ErrorCode: The error code.
+        """
+        error = cls(code, msg)
+        error.params = None
+        return error
+
+    @classmethod
+    def from_exception(cls, exception, code='invalid'):
+        """
+        Creates an error code for a ValidationException raised by a validator or hook.
+
+        The exception is kept, so that it can be raised again as-is.
+
+        Args:
+            exception (ValidationException): The exception.
+            code (str, optional): The error code. Defaults to 'invalid'.
+
+        Returns:
+            ErrorCode: The error code.
+        """
+        error = cls.from_message(exception.error_msg, code)
+        error.exception = exception
+        return error
+
+    def message(self, name):
+        """
+        Renders the error message for a property.
+
+        Args:
+            name (str): The name of the property.
+
+        Returns:
+            str: The error message.
+        """
+        if self.params is None:
+            return self.template
+        return self.template.format(name=name, **self.params)
+
+    def to_exception(self, name):
+        """
+        Returns the exception for a property, which is the original one if the error was created from an exception.
+
+        Args:
+            name (str): The name of the property.
+
+        Returns:
+            ValidationException: The exception.
+        """
+        if self.exception is not None:
+            return self.exception
+        return ValidationException(self.message(name))
+
+    def __eq__(self, other):
+        if not isinstance(other, ErrorCode):
+            return NotImplemented
+        return (self.code, self.template, self.params) == (other.code, other.template, other.params)
+
+    def __hash__(self):
+        return hash((self.code, self.template))
+
+    def __repr__(self):
+        return f'ErrorCode({self.code!r})'
@@ -0,0 +1,361 @@
+"""
+Opt-in profiling of schema validation.
+
+While enabled, every validation records call counts, cumulative time and
+failures per schema class, per field and per validator class of the field:
+
+    from valley import instrument
+
+    instrument.enable()
+    ...
+    instrument.snapshot()['valley.tests.examples.example_schemas.Student']['fields']['email']
+
+Enabling recompiles the validation plans of all schema classes with timing
+wrappers and swaps in timed versions of ``BaseSchema.validate`` and the row
+validator of ``validate_many``; disabling restores the originals, so the
+validation path has no instrumentation checks while disabled. Validators in an
+adaptive chain are recorded together as ``AdaptiveChain``, and cached
+validation results are recorded for the field only. The time and failures of
+a field's ``{key}_validate`` hook are added to the field. Coroutine validators and
+hooks awaited by ``avalidate`` are not recorded.
+
+Every thread records into its own shard of the counters, so recording takes no
+locks; the shards are summed when the statistics are read.
+"""
+import threading
+import time
+from threading import get_ident
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from valley.exceptions import ValidationException
+
+__all__ = ['enable', 'disable', 'remove_callback', 'is_enabled', 'snapshot', 'reset', 'Stats']
+
+# Called with the schema class, the nanoseconds and whether it failed after every schema validation
+Callback = Callable[[type, int, bool], None]
+
+_enabled = False
+_callbacks: Tuple[Callback, ...] = ()
+_lock = threading.Lock()
+_originals: Dict[str, Any] = {}
+# Schema name -> Stats, with the fields and their validators nested in Stats.children
+_stats: Dict[str, 'Stats'] = {}
+
+
+class Stats:
+    """
+    The call count, cumulative time and failure count of a schema, field or validator.
+
+    Attributes:
+        children (Dict[str, Stats]): The fields of a schema or the validators of a field.
+    """
+    __slots__ = ('_shards', 'children')
+
+    def __init__(self) -> None:
+        # Thread id -> [calls, nanoseconds, failures], only ever changed by its own thread
+        self._shards: Dict[int, List[int]] = {}
+        self.children: Dict[str, Stats] = {}
+
+    def _total(self, index: int) -> int:
+        return sum(shard[index] for shard in list(self._shards.values()))
+
+    @property
+    def calls(self) -> int:
+        """
+        The number of calls.
+        """
+        return self._total(0)
+
+    @property
+    def nanoseconds(self) -> int:
+        """
+        The cumulative time of the calls in nanoseconds.
+        """
+        return self._total(1)
+
+    @property
+    def failures(self) -> int:
+        """
+        The number of calls that found the value or schema invalid.
+        """
+        return self._total(2)
+
+    def child(self, name: str) -> 'Stats':
+        stats = self.children.get(name)
+        if stats is None:
+            stats = self.children.setdefault(name, Stats())
+        return stats
+
+    def record(self, nanoseconds: int, failed: bool) -> None:
+        thread = get_ident()
+        shard = self._shards.get(thread)
+        if shard is None:
+            shard = self._shards.setdefault(thread, [0, 0, 0])
+        shard[0] += 1
+        shard[1] += nanoseconds
+        if failed:
+            shard[2] += 1
+
+    def extend(self, nanoseconds: int, failed: bool) -> None:
+        # Adds to the call recorded last without counting another one, e.g. the hook of a checked field
+        thread = get_ident()
+        shard = self._shards.get(thread)
+        if shard is None:
+            shard = self._shards.setdefault(thread, [0, 0, 0])
+        shard[1] += nanoseconds
+        if failed:
+            shard[2] += 1
+
+    def clear(self) -> None:
+        self._shards.clear()
+        for child in list(self.children.values()):
+            child.clear()
+
+    def as_dict(self) -> Dict[str, Any]:
+        shards = list(self._shards.values())
+        return {'calls': sum(shard[0] for shard in shards), 'time_ns': sum(shard[1] for shard in shards),
+                'failures': sum(shard[2] for shard in shards)}
+
+
+def is_enabled() -> bool:
+    """
+    Returns whether validation is being instrumented.
+    """
+    return _enabled
+
+
+def enable(callback: Optional[Callback] = None) -> None:
+    """
+    Starts recording validation statistics.
+
+    Calling it again while enabled only adds the callback.
+
+    Args:
+        callback (Optional[Callback], optional): Called with the schema class, the time in nanoseconds and
+            whether the schema was invalid after every validate() call and every row of validate_many().
+    """
+    global _enabled, _callbacks
+    from valley.schema import BaseSchema
+    with _lock:
+        if callback is not None and callback not in _callbacks:
+            _callbacks += (callback,)
+        if _enabled:
+            return
+        _originals['validate'] = BaseSchema.__dict__['validate']
+        _originals['_make_row_validator'] = BaseSchema.__dict__['_make_row_validator']
+        BaseSchema.validate = _timed_validate(_originals['validate'])
+        BaseSchema._make_row_validator = classmethod(_timed_row_validator(_originals['_make_row_validator'].__func__))
+        _enabled = True
+        _reset_plans(BaseSchema)
+
+
+def disable() -> None:
+    """
+    Stops recording validation statistics and restores the uninstrumented validation path.
+
+    The statistics recorded so far are kept until reset(), and all callbacks are removed.
+    """
+    global _enabled, _callbacks
+    from valley.schema import BaseSchema
+    with _lock:
+        if not _enabled:
+            return
+        BaseSchema.validate = _originals.pop('validate')
+        BaseSchema._make_row_validator = _originals.pop('_make_row_validator')
+        _enabled = False
+        _callbacks = ()
+        _reset_plans(BaseSchema)
+
+
+def remove_callback(callback: Callback) -> None:
+    """
+    Removes a callback passed to enable(), leaving instrumentation enabled.
+
+    Args:
+        callback (Callback): The callback.
+    """
+    global _callbacks
+    with _lock:
+        _callbacks = tuple(existing for existing in _callbacks if existing is not callback)
+
+
+def reset() -> None:
+    """
+    Discards the statistics recorded so far.
+    """
+    with _lock:
+        for stats in list(_stats.values()):
+            stats.clear()
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns a copy of the statistics recorded so far.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The ``calls``, ``time_ns`` and ``failures`` of every schema, keyed by
+        the module and qualified name of its class. Each schema has a ``fields`` dictionary with the
+        same statistics per field, and each field a ``validators`` dictionary per validator class.
+    """
+    result = {}
+    for name, schema_stats in list(_stats.items()):
+        schema = result[name] = schema_stats.as_dict()
+        schema['fields'] = fields = {}
+        for key, field_stats in list(schema_stats.children.items()):
+            field = fields[key] = field_stats.as_dict()
+            field['validators'] = {validator: stats.as_dict()
+                                   for validator, stats in list(field_stats.children.items())}
+    return result
+
+
+def _reset_plans(base: type) -> None:
+    # Plans are compiled on first use, so removing them recompiles them with or without instrumentation
+    pending = [base]
+    while pending:
+        klass = pending.pop()
+        pending.extend(klass.__subclasses__())
+        if '_validation_plan' in klass.__dict__:
+            del klass._validation_plan
+
+
+def schema_stats(schema_class: type) -> Stats:
+    """
+    Returns the statistics of a schema class, creating them on first use.
+
+    Args:
+        schema_class (type): The schema class.
+
+    Returns:
+        Stats: The statistics of the schema class.
+    """
+    name = f'{schema_class.__module__}.{schema_class.__qualname__}'
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _stats.setdefault(name, Stats())
+    return stats
+
+
+def wrap_field(stats: Stats, check: Callable, coerce: bool) -> Callable:
+    """
+    Wraps the compiled check of a field so that its calls are recorded.
+
+    Args:
+        stats (Stats): The statistics of the field.
+        check (Callable): The function returned by compile_check() or, with ``coerce``, compile_coerce().
+        coerce (bool): Whether ``check`` returns the parsed value along with the error.
+
+    Returns:
+        Callable: The instrumented check.
+    """
+    clock = time.perf_counter_ns
+    record = stats.record
+    if coerce:
+        def instrumented(value: Any) -> Any:
+            start = clock()
+            result = check(value)
+            record(clock() - start, result[1] is not None)
+            return result
+    else:
+        def instrumented(value: Any) -> Any:
+            start = clock()
+            error = check(value)
+            record(clock() - start, error is not None)
+            return error
+    instrumented.adaptive_chain = getattr(check, 'adaptive_chain', None)
+    return instrumented
+
+
+def wrap_hook(stats: Stats, hook: Callable) -> Callable:
+    """
+    Wraps the ``{key}_validate`` hook of a field so that its time and failures are added to the field.
+
+    The hook only runs after the field's check passed, so it is not counted as another call.
+
+    Args:
+        stats (Stats): The statistics of the field.
+        hook (Callable): The hook taking ``(instance, value)``.
+
+    Returns:
+        Callable: The instrumented hook.
+    """
+    clock = time.perf_counter_ns
+    extend = stats.extend
+
+    def instrumented(instance: Any, value: Any) -> None:
+        start = clock()
+        try:
+            hook(instance, value)
+        except ValidationException:
+            extend(clock() - start, True)
+            raise
+        extend(clock() - start, False)
+    return instrumented
+
+
+def validator_wrapper(stats: Stats) -> Callable[[Any, Callable, bool], Callable]:
+    """
+    Creates the ``wrap`` argument of compile_check() that records the validators of a field.
+
+    Args:
+        stats (Stats): The statistics of the field.
+
+    Returns:
+        Callable[[Any, Callable, bool], Callable]: The wrapper.
+    """
+    clock = time.perf_counter_ns
+
+    def wrap(validator: Any, fn: Callable, parses: bool) -> Callable:
+        record = stats.child(type(validator).__name__).record
+        if parses:
+            def instrumented(value: Any) -> Any:
+                start = clock()
+                result = fn(value)
+                record(clock() - start, result[1] is not None)
+                return result
+        else:
+            def instrumented(value: Any) -> Any:
+                start = clock()
+                error = fn(value)
+                record(clock() - start, error is not None)
+                return error
+        return instrumented
+    return wrap
+
+
+def _finish(schema_class: type, nanoseconds: int, failed: bool) -> None:
+    schema_stats(schema_class).record(nanoseconds, failed)
+    for callback in _callbacks:
+        callback(schema_class, nanoseconds, failed)
+
+
+def _timed_validate(validate: Callable) -> Callable:
+    clock = time.perf_counter_ns
+
+    def timed_validate(self: Any, *args: Any, **kwargs: Any) -> Any:
+        start = clock()
+        try:
+            result = validate(self, *args, **kwargs)
+        except Exception:
+            _finish(type(self), clock() - start, True)
+            raise
+        _finish(type(self), clock() - start, not self._is_valid)
+        return result
+    timed_validate.__doc__ = validate.__doc__
+    timed_validate.__wrapped__ = validate
+    return timed_validate
+
+
+def _timed_row_validator(make_row_validator: Callable) -> Callable:
+    clock = time.perf_counter_ns
+
+    def timed_make_row_validator(cls: type) -> Callable:
+        validate_row = make_row_validator(cls)
+
+        def timed_validate_row(row: Dict[str, Any]) -> Any:
+            start = clock()
+            data, row_errors = validate_row(row)
+            _finish(cls, clock() - start, row_errors is not None)
+            return data, row_errors
+        return timed_validate_row
+    timed_make_row_validator.__wrapped__ = make_row_validator
+    return timed_make_row_validator
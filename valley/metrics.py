@@ -0,0 +1,193 @@
+"""
+Validation metrics in the Prometheus text exposition format.
+
+metrics.enable() turns on valley.instrument and additionally records a latency
+histogram per schema class. render() returns, and write() stores, the following
+metrics without needing a server:
+
+- ``valley_validations_total{schema}``: validations per schema.
+- ``valley_validation_failures_total{schema}``: validations that found the schema invalid.
+- ``valley_field_rejections_total{schema,field}``: rejected values per field.
+- ``valley_validator_rejections_total{schema,validator}``: rejections per validator class.
+- ``valley_validation_duration_seconds{schema}``: a histogram of the validation latency.
+
+Like the instrument counters, the histograms are sharded per thread, so recording
+takes no locks.
+"""
+import bisect
+import os
+import threading
+from threading import get_ident
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from valley import instrument
+
+__all__ = ['enable', 'disable', 'render', 'write', 'Histogram', 'DEFAULT_BUCKETS']
+
+# The upper bounds of the latency buckets in seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+                                      0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+_lock = threading.Lock()
+_buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+_histograms: Dict[str, 'Histogram'] = {}
+
+
+class Histogram:
+    """
+    A latency histogram whose observations are sharded per thread.
+
+    Attributes:
+        buckets (Tuple[float, ...]): The upper bounds of the buckets in seconds, in ascending order.
+    """
+    __slots__ = ('buckets', '_bounds_ns', '_shards')
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._bounds_ns = [bound * 1e9 for bound in self.buckets]
+        # Thread id -> bucket counts followed by the sum in nanoseconds, only changed by its own thread
+        self._shards: Dict[int, List[int]] = {}
+
+    def observe(self, nanoseconds: int) -> None:
+        """
+        Records an observation.
+
+        Args:
+            nanoseconds (int): The observed latency in nanoseconds.
+        """
+        thread = get_ident()
+        shard = self._shards.get(thread)
+        if shard is None:
+            shard = self._shards.setdefault(thread, [0] * (len(self.buckets) + 2))
+        shard[bisect.bisect_left(self._bounds_ns, nanoseconds)] += 1
+        shard[-1] += nanoseconds
+
+    def totals(self) -> Tuple[List[int], int, float]:
+        """
+        Sums the shards.
+
+        Returns:
+            Tuple[List[int], int, float]: The cumulative count of every bucket, the total count
+            and the sum of the observations in seconds.
+        """
+        counts = [0] * (len(self.buckets) + 1)
+        total_ns = 0
+        for shard in list(self._shards.values()):
+            for index in range(len(counts)):
+                counts[index] += shard[index]
+            total_ns += shard[-1]
+        cumulative = []
+        running = 0
+        for count in counts[:-1]:
+            running += count
+            cumulative.append(running)
+        return cumulative, running + counts[-1], total_ns / 1e9
+
+
+def enable(buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+    """
+    Starts recording validation metrics, enabling valley.instrument if it is not enabled yet.
+
+    Args:
+        buckets (Sequence[float], optional): The upper bounds of the latency buckets in seconds.
+    """
+    global _buckets
+    with _lock:
+        if tuple(buckets) != _buckets:
+            _buckets = tuple(buckets)
+            _histograms.clear()
+    instrument.enable(_observe)
+
+
+def disable() -> None:
+    """
+    Stops recording latency histograms. valley.instrument stays enabled until instrument.disable() is called.
+    """
+    instrument.remove_callback(_observe)
+
+
+def _observe(schema_class: type, nanoseconds: int, failed: bool) -> None:
+    name = f'{schema_class.__module__}.{schema_class.__qualname__}'
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms.setdefault(name, Histogram(_buckets))
+    histogram.observe(nanoseconds)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels: str) -> str:
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _format(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _lines(snapshot: Dict[str, dict]) -> Iterator[str]:
+    def header(name: str, kind: str, description: str) -> Iterator[str]:
+        yield f'# HELP {name} {description}'
+        yield f'# TYPE {name} {kind}'
+
+    yield from header('valley_validations_total', 'counter', 'Schema validations.')
+    for schema, stats in snapshot.items():
+        yield f'valley_validations_total{_labels(schema=schema)} {stats["calls"]}'
+
+    yield from header('valley_validation_failures_total', 'counter', 'Schema validations that found the schema invalid.')
+    for schema, stats in snapshot.items():
+        yield f'valley_validation_failures_total{_labels(schema=schema)} {stats["failures"]}'
+
+    yield from header('valley_field_rejections_total', 'counter', 'Values rejected per field.')
+    for schema, stats in snapshot.items():
+        for field, field_stats in stats['fields'].items():
+            yield f'valley_field_rejections_total{_labels(schema=schema, field=field)} {field_stats["failures"]}'
+
+    yield from header('valley_validator_rejections_total', 'counter', 'Values rejected per validator class.')
+    for schema, stats in snapshot.items():
+        rejections: Dict[str, int] = {}
+        for field_stats in stats['fields'].values():
+            for validator, validator_stats in field_stats['validators'].items():
+                rejections[validator] = rejections.get(validator, 0) + validator_stats['failures']
+        for validator, failures in sorted(rejections.items()):
+            yield f'valley_validator_rejections_total{_labels(schema=schema, validator=validator)} {failures}'
+
+    yield from header('valley_validation_duration_seconds', 'histogram', 'Schema validation latency.')
+    for schema, histogram in sorted(_histograms.items()):
+        cumulative, count, seconds = histogram.totals()
+        for bound, bucket_count in zip(histogram.buckets + (float('inf'),), cumulative + [count]):
+            yield f'valley_validation_duration_seconds_bucket{_labels(schema=schema, le=_format(bound))} {bucket_count}'
+        yield f'valley_validation_duration_seconds_sum{_labels(schema=schema)} {_format(seconds)}'
+        yield f'valley_validation_duration_seconds_count{_labels(schema=schema)} {count}'
+
+
+def render() -> str:
+    """
+    Renders the metrics in the Prometheus text exposition format.
+
+    Returns:
+        str: The metrics, one sample per line.
+    """
+    snapshot = dict(sorted(instrument.snapshot().items()))
+    return '\n'.join(_lines(snapshot)) + '\n'
+
+
+def write(path: str, text: Optional[str] = None) -> None:
+    """
+    Writes the metrics to a file, e.g. for the textfile collector of the node exporter.
+
+    The file is replaced atomically, so scrapers never read a partial file.
+
+    Args:
+        path (str): The path of the file.
+        text (Optional[str], optional): Metrics rendered earlier. Defaults to render().
+    """
+    if text is None:
+        text = render()
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temporary, path)
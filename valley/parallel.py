@@ -0,0 +1,70 @@
+import collections
+import itertools
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from valley.exceptions import ErrorCode
+from valley.schema import BaseSchema, ValidationBatch
+
+__all__ = ['validate_parallel']
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def validate_parallel(schema_class: Type[BaseSchema], rows: Iterable[Dict[str, Any]],
+                      chunk_size: int = DEFAULT_CHUNK_SIZE, max_workers: Optional[int] = None,
+                      executor: Optional[Executor] = None, max_pending: Optional[int] = None) -> ValidationBatch:
+    """
+    Validates many rows across a pool of processes.
+
+    The rows are split into chunks of ``chunk_size`` that are validated with
+    ``schema_class.validate_many`` in worker processes, and the results are merged
+    back in input order. At most ``max_pending`` chunks are in flight at a time, so
+    ``rows`` may be a lazy iterator. The schema class must be importable by the
+    workers, i.e. defined at module level.
+
+    Args:
+        schema_class (Type[BaseSchema]): The Schema subclass to validate against.
+        rows (Iterable[Dict[str, Any]]): The rows to validate.
+        chunk_size (int, optional): The number of rows sent to a worker at a time.
+        max_workers (Optional[int], optional): The number of worker processes. Defaults to the number of CPUs.
+        executor (Optional[Executor], optional): An existing executor to use instead of creating a process pool.
+        max_pending (Optional[int], optional): The maximum number of chunks in flight. Defaults to twice
+            ``max_workers`` or, if that is not given, twice the number of CPUs.
+
+    Returns:
+        ValidationBatch: The same result ``schema_class.validate_many(rows)`` would return.
+    """
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return validate_parallel(schema_class, rows, chunk_size, max_workers, pool, max_pending)
+
+    if max_pending is None:
+        max_pending = 2 * (max_workers or os.cpu_count() or 1)
+    valid: List[Dict[str, Any]] = []
+    error_codes: Dict[int, Dict[str, ErrorCode]] = {}
+    pending = collections.deque()
+
+    def merge(future: Any) -> None:
+        start, batch = future.result()
+        valid.extend(batch.valid)
+        for index, row_errors in batch.error_codes.items():
+            error_codes[start + index] = row_errors
+
+    rows = iter(rows)
+    for start in itertools.count(0, chunk_size):
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            break
+        pending.append(executor.submit(_validate_chunk, schema_class, start, chunk))
+        if len(pending) >= max_pending:
+            merge(pending.popleft())
+    while pending:
+        merge(pending.popleft())
+    return ValidationBatch(valid, error_codes)
+
+
+def _validate_chunk(schema_class: Type[BaseSchema], start: int,
+                    rows: List[Dict[str, Any]]) -> Tuple[int, ValidationBatch]:
+    return start, schema_class.validate_many(rows)
@@ -1,10 +1,11 @@
-import json
+import datetime
 from collections.abc import Callable
-from typing import Any, Optional, Type, List, Dict
+from typing import Any, Hashable, NamedTuple, Optional, Type, List, Dict, Tuple
 
-from valley.utils.json_utils import ValleyEncoder
+from valley.adaptive import AdaptiveChain
+from valley.exceptions import ErrorCode, ValidationException
 from .validators import (
-    RequiredValidator, StringValidator, MaxLengthValidator, MinLengthValidator,
+    Validator, as_check, as_coerce, is_coroutine_validator, RequiredValidator, StringValidator, MaxLengthValidator, MinLengthValidator,
     IntegerValidator, MaxValueValidator, MinValueValidator, FloatValidator,
     DateValidator, DateTimeValidator, BooleanValidator, SlugValidator,
     EmailValidator, DictValidator, ChoiceValidator, ListValidator,
@@ -18,6 +19,105 @@ __all__ = [
     'ForeignListProperty', 'MultiProperty'
 ]
 
+# Immutable types whose validation results may be cached; subclasses are excluded on purpose
+# decimal.Decimal is added when a cache is created, to keep the decimal module out of the import
+CACHEABLE_TYPES = frozenset({str, bytes, int, float, bool, complex,
+                             datetime.date, datetime.datetime, datetime.time})
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of a property's validation result cache.
+    """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ResultCache:
+    """
+    A bounded LRU cache of the validation results of one property.
+
+    Every check compiled for the property, by any schema class that declares or inherits
+    it, shares the cache, so its size and statistics do not depend on how often or by
+    how many classes the property is compiled. Results are keyed by the kind of check
+    they come from as well as by the value and its type. Errors that validators raised
+    as exceptions are not cached.
+
+    Attributes:
+        maxsize (int): The maximum number of results kept.
+        hits (int): The number of results served from the cache.
+        misses (int): The number of results computed and added to the cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        from collections import OrderedDict
+        from decimal import Decimal
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._cacheable_types = CACHEABLE_TYPES | {Decimal}
+
+    def memoize(self, fn: Callable[[Any], Any], variant: Hashable, cache_falsy: bool = True) -> Callable[[Any], Any]:
+        """
+        Wraps a check function so that its results for cacheable values are kept in the cache.
+
+        Args:
+            fn (Callable): The check function.
+            variant (Hashable): Identifies what the function computes, e.g. the property key and
+                the compile options; functions with the same variant must return the same results.
+            cache_falsy (bool, optional): Cache falsy values too. Pass False if a dynamic default is
+                substituted for them.
+
+        Returns:
+            Callable: The memoized function.
+        """
+        results = self._results
+        cacheable_types = self._cacheable_types
+
+        def memoized(value: Any) -> Any:
+            value_type = type(value)
+            if value_type not in cacheable_types or not (cache_falsy or value):
+                return fn(value)
+            cache_key = (variant, value_type, value)
+            try:
+                result = results[cache_key]
+                results.move_to_end(cache_key)
+            except KeyError:
+                self.misses += 1
+                result = fn(value)
+                error = result[1] if type(result) is tuple else result
+                # Errors raised as exceptions are not cached: raising the same exception again would
+                # grow its traceback and keep the frames, and the schema instances in them, alive
+                if error is None or error.exception is None:
+                    results[cache_key] = result
+                    if len(results) > self.maxsize:
+                        results.popitem(last=False)
+            else:
+                self.hits += 1
+            return result
+        memoized.adaptive_chain = fn.adaptive_chain
+        return memoized
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Get the hit and miss statistics of the cache.
+
+        Returns:
+            CacheInfo: The hits, misses, maximum size and current size of the cache.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    def cache_clear(self) -> None:
+        """
+        Remove all results and reset the statistics.
+        """
+        self._results.clear()
+        self.hits = self.misses = 0
+
+
 class BaseProperty:
     """
     Base class for defining properties in the Valley library.
@@ -26,31 +126,51 @@ class BaseProperty:
         default_value (Any): The default value for the property.
         required (bool): Indicates whether the property is required.
         validators (List[Callable]): A list of validators for the property.
-        choices (Optional[List[Any]]): A list of choices for the property value.
-        kwargs (dict): Additional keyword arguments.
+        choices (Optional[Any]): The choices for the property value, in any form ChoiceValidator accepts.
+        kwargs (dict): Additional keyword arguments. ``cache_size`` enables an LRU cache of
+            that many validation results, for values of the types in CACHEABLE_TYPES.
 
+    The validators are built by get_validators() when they are first accessed, so
+    properties of schemas that are never validated cost no more than their arguments.
     """
     default_value: Any = None
     allow_required: bool = True
+    # The LRU cache shared by every check compiled for the property, created on first use if cache_size is set
+    _result_cache: Optional[ResultCache] = None
 
     def __init__(self, default_value: Any = None, required: bool = False,
                  validators: Optional[List[Callable]] = None,
-                 choices: Optional[Dict[str, Any]] = None, **kwargs):
+                 choices: Optional[Any] = None, **kwargs):
         self.default_value = default_value
         self.required = required
-        self.validators = validators if validators is not None else []
+        self._validators = validators if validators is not None else []
+        self._validators_built = False
         self.choices = choices
         self.kwargs = kwargs
-        self.get_validators()
+
+    @property
+    def validators(self) -> List[Validator]:
+        """
+        The validators of the property, built by get_validators() on first access.
+        """
+        if not self._validators_built:
+            self._validators_built = True
+            self.get_validators()
+        return self._validators
+
+    @validators.setter
+    def validators(self, validators: List[Validator]) -> None:
+        self._validators_built = True
+        self._validators = validators
 
     def get_validators(self) -> None:
         """
         Initialize the validators for the property based on its configuration.
         """
         if self.required:
-            self.validators.insert(0, RequiredValidator())
+            self.validators.insert(0, RequiredValidator.shared())
         if self.choices:
-            self.validators.insert(0, ChoiceValidator(self.choices))
+            self.validators.insert(0, ChoiceValidator.shared(self.choices))
 
     def validate(self, value: Any, key: str) -> None:
         """
@@ -63,11 +183,247 @@ class BaseProperty:
         Raises:
             ValidationException: If the value does not pass the validation checks.
         """
-        if not value and not isinstance(self.get_default_value(), type(None)):
-            value = self.get_default_value()
+        if not value:
+            default = self.get_default_value()
+            if default is not None:
+                value = default
         for validator in self.validators:
             validator.validate(value, key)
 
+    @property
+    def is_async(self) -> bool:
+        """
+        Whether any of the property's validators is a coroutine function.
+        """
+        return any(is_coroutine_validator(validator) for validator in self.validators)
+
+    async def avalidate(self, value: Any, key: str) -> None:
+        """
+        Validate the value of the property, awaiting coroutine validators.
+
+        Args:
+            value (Any): The value to be validated.
+            key (str): The key associated with the property.
+
+        Raises:
+            ValidationException: If the value does not pass the validation checks.
+        """
+        import inspect
+        if not value:
+            default = self.get_default_value()
+            if default is not None:
+                value = default
+        for validator in self.validators:
+            result = validator.validate(value, key)
+            if inspect.isawaitable(result):
+                await result
+
+    def compile_check(self, key: str, adaptive: bool = False,
+                      wrap: Optional[Callable[[Any, Callable, bool], Callable]] = None,
+                      substitute_default: bool = True) -> Callable[[Any], Optional[ErrorCode]]:
+        """
+        Build a specialized check function equivalent to ``validate(value, key)``.
+
+        The default handling and the validator chain are resolved once, and validators
+        are called through their exception-free check(), so the returned function only
+        has to run the validators themselves and returns the first error instead of
+        raising it.
+
+        With ``adaptive``, the trailing reorderable validators run through an
+        AdaptiveChain, which is exposed as the ``adaptive_chain`` attribute of the
+        returned function. Which error is reported for a value that fails several
+        of them then depends on the learned order.
+
+        Args:
+            key (str): The key associated with the property.
+            adaptive (bool, optional): Reorder the reorderable validators by their measured cost and rejection rate.
+            wrap (Optional[Callable], optional): Called with every validator, its check function and whether
+                the function parses values, returning the function to use instead, e.g. to instrument it.
+            substitute_default (bool, optional): Check the default instead of falsy values. Pass False if
+                the caller substitutes the default itself, e.g. to call a default factory only once.
+
+        Returns:
+            Callable[[Any], Optional[ErrorCode]]: A function returning the error of an invalid value, or None.
+        """
+        if type(self).validate is not BaseProperty.validate:
+            validate = self.validate
+
+            def check(value: Any) -> Optional[ErrorCode]:
+                try:
+                    validate(value, key)
+                except ValidationException as e:
+                    return ErrorCode.from_exception(e)
+                return None
+            check.adaptive_chain = None
+            # validate() substitutes the default itself
+            return self._memoize(check, ('validate', key), cache_falsy=not self.has_dynamic_default())
+
+        all_steps, none_steps, chain = self._compile_steps(key, adaptive, coerce=False, wrap=wrap)
+        get_default = self._compile_default() if substitute_default else None
+
+        def check(value: Any) -> Optional[ErrorCode]:
+            if not value and get_default is not None:
+                default = get_default()
+                if default is not None:
+                    value = default
+            for fn in (none_steps if value is None else all_steps):
+                error = fn(value)
+                if error is not None:
+                    return error
+            return None
+        check.adaptive_chain = chain
+        return self._memoize(check, ('check', key, adaptive, substitute_default),
+                             cache_falsy=not (substitute_default and self.has_dynamic_default()))
+
+    def compile_coerce(self, key: str, adaptive: bool = False,
+                       wrap: Optional[Callable[[Any, Callable, bool], Callable]] = None,
+                       substitute_default: bool = True) -> Callable[[Any], Tuple[Any, Optional[ErrorCode]]]:
+        """
+        Build a function that validates a value like compile_check() and also returns it parsed.
+
+        Validators that parse their input, such as IntegerValidator, pass the parsed value on
+        to the validators after them, so e.g. MinValueValidator compares the integer rather
+        than the string it was parsed from, and each value is parsed only once.
+
+        Args:
+            key (str): The key associated with the property.
+            adaptive (bool, optional): Reorder the reorderable validators by their measured cost and rejection rate.
+            wrap (Optional[Callable], optional): See compile_check().
+            substitute_default (bool, optional): See compile_check().
+
+        Returns:
+            Callable[[Any], Tuple[Any, Optional[ErrorCode]]]: A function returning the parsed value,
+            after substituting the default, and the error of an invalid value, or None.
+        """
+        if type(self).validate is not BaseProperty.validate:
+            # Already memoized by compile_check()
+            check = self.compile_check(key, wrap=wrap, substitute_default=substitute_default)
+
+            def coerce(value: Any) -> Tuple[Any, Optional[ErrorCode]]:
+                return value, check(value)
+            coerce.adaptive_chain = None
+            return coerce
+
+        all_steps, none_steps, chain = self._compile_steps(key, adaptive, coerce=True, wrap=wrap)
+        get_default = self._compile_default() if substitute_default else None
+
+        def coerce(value: Any) -> Tuple[Any, Optional[ErrorCode]]:
+            if not value and get_default is not None:
+                default = get_default()
+                if default is not None:
+                    value = default
+            if value is None:
+                for fn in none_steps:
+                    error = fn(value)
+                    if error is not None:
+                        return value, error
+                return value, None
+            for parses, fn in all_steps:
+                if parses:
+                    value, error = fn(value)
+                else:
+                    error = fn(value)
+                if error is not None:
+                    return value, error
+            return value, None
+        coerce.adaptive_chain = chain
+        return self._memoize(coerce, ('coerce', key, adaptive, substitute_default),
+                             cache_falsy=not (substitute_default and self.has_dynamic_default()))
+
+    def coerce(self, value: Any) -> Any:
+        """
+        Parse a valid value into the type its validators check for.
+
+        Args:
+            value (Any): A value that passed validation.
+
+        Returns:
+            Any: The parsed value, or the value itself if none of the validators parse values.
+        """
+        for validator in self.validators:
+            fn = as_coerce(validator)
+            if fn is not None and value is not None:
+                value, _ = fn(value)
+        return value
+
+    def _compile_steps(self, key: str, adaptive: bool, coerce: bool,
+                       wrap: Optional[Callable[[Any, Callable, bool], Callable]] = None
+                       ) -> Tuple[tuple, tuple, Optional[AdaptiveChain]]:
+        validators = list(self.validators)
+        chain = None
+        if adaptive:
+            split = len(validators)
+            while split and validators[split - 1].reorderable:
+                split -= 1
+            if len(validators) - split > 1:
+                chain = AdaptiveChain(validators[split:], key)
+                validators = validators[:split]
+
+        steps = []
+        for validator in validators:
+            # A custom validate() decides for itself how to handle None
+            runs_on_none = validator.is_required_regardless or type(validator).validate is not Validator.validate
+            check = as_check(validator, key)
+            parse = as_coerce(validator) if coerce else None
+            if wrap is not None:
+                check = wrap(validator, check, False)
+                parse = wrap(validator, parse, True) if parse is not None else None
+            steps.append((runs_on_none, check, parse))
+        if chain is not None:
+            steps.append((False, chain if wrap is None else wrap(chain, chain, False), None))
+        # None is never parsed, so only the checks run for it
+        none_steps = tuple(check for runs_on_none, check, _ in steps if runs_on_none)
+        if coerce:
+            all_steps = tuple((True, parse) if parse is not None else (False, check) for _, check, parse in steps)
+        else:
+            all_steps = tuple(check for _, check, _ in steps)
+        return all_steps, none_steps, chain
+
+    def has_dynamic_default(self) -> bool:
+        """
+        Whether get_default_value() may return a different value on every call, e.g. for a callable default.
+
+        Returns:
+            bool: False if the default can be computed once and shared.
+        """
+        return (type(self).get_default_value is not BaseProperty.get_default_value
+                or isinstance(self.default_value, Callable))
+
+    def _compile_default(self) -> Callable[[], Any]:
+        if self.has_dynamic_default():
+            return self.get_default_value
+        static_default = self.get_default_value()
+        return lambda: static_default
+
+    def _memoize(self, fn: Callable[[Any], Any], variant: Hashable, cache_falsy: bool = True) -> Callable[[Any], Any]:
+        cache_size = self.kwargs.get('cache_size')
+        if not cache_size:
+            return fn
+        cache = self._result_cache
+        if cache is None:
+            cache = self._result_cache = ResultCache(cache_size)
+        return cache.memoize(fn, variant, cache_falsy)
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """
+        Get the hit and miss statistics of the validation result cache.
+
+        Returns:
+            Optional[CacheInfo]: The hits, misses, maximum size and current size of the cache, which
+            every schema using the property shares, or None if ``cache_size`` is not set or the
+            property has not been compiled yet.
+        """
+        if self._result_cache is None:
+            return None
+        return self._result_cache.cache_info()
+
+    def cache_clear(self) -> None:
+        """
+        Clear the validation result cache, e.g. after changing the property's validators.
+        """
+        if self._result_cache is not None:
+            self._result_cache.cache_clear()
+
     def get_default_value(self) -> Any:
         """
         Get the default value of the property.
@@ -119,11 +475,11 @@ class StringProperty(BaseProperty):
         Initialize the validators for the CharProperty.
         """
         super().get_validators()
-        self.validators.append(StringValidator())
+        self.validators.append(StringValidator.shared())
         if 'min_length' in self.kwargs:
-            self.validators.append(MinLengthValidator(self.kwargs['min_length']))
+            self.validators.append(MinLengthValidator.shared(self.kwargs['min_length']))
         if 'max_length' in self.kwargs:
-            self.validators.append(MaxLengthValidator(self.kwargs['max_length']))
+            self.validators.append(MaxLengthValidator.shared(self.kwargs['max_length']))
 
     def get_python_value(self, value: Any) -> Optional[str]:
         """
@@ -152,11 +508,11 @@ class IntegerProperty(BaseProperty):
         Initialize the validators for the IntegerProperty.
         """
         super().get_validators()
-        self.validators.append(IntegerValidator())
+        self.validators.append(IntegerValidator.shared())
         if 'min_value' in self.kwargs:
-            self.validators.append(MinValueValidator(self.kwargs['min_value']))
+            self.validators.append(MinValueValidator.shared(self.kwargs['min_value']))
         if 'max_value' in self.kwargs:
-            self.validators.append(MaxValueValidator(self.kwargs['max_value']))
+            self.validators.append(MaxValueValidator.shared(self.kwargs['max_value']))
 
 
 class FloatProperty(BaseProperty):
@@ -171,7 +527,7 @@ class FloatProperty(BaseProperty):
         Initialize the validators for the FloatProperty.
         """
         super().get_validators()
-        self.validators.append(FloatValidator())
+        self.validators.append(FloatValidator.shared())
 
 
 class BooleanProperty(BaseProperty):
@@ -186,7 +542,7 @@ class BooleanProperty(BaseProperty):
         Initialize the validators for the BooleanProperty.
         """
         super().get_validators()
-        self.validators.append(BooleanValidator())
+        self.validators.append(BooleanValidator.shared())
 
     def get_default_value(self) -> bool:
         """
@@ -198,6 +554,15 @@ class BooleanProperty(BaseProperty):
         default = self.default_value
         return bool(default)
 
+    def has_dynamic_default(self) -> bool:
+        """
+        The default of a BooleanProperty only depends on default_value, so it is never dynamic.
+
+        Returns:
+            bool: False.
+        """
+        return False
+
 
 class DateProperty(BaseProperty):
     """
@@ -211,7 +576,7 @@ class DateProperty(BaseProperty):
         Initialize the validators for the DateProperty.
         """
         super().get_validators()
-        self.validators.append(DateValidator())
+        self.validators.append(DateValidator.shared())
 
 
 class DateTimeProperty(BaseProperty):
@@ -226,7 +591,7 @@ class DateTimeProperty(BaseProperty):
         Initialize the validators for the DateTimeProperty.
         """
         super().get_validators()
-        self.validators.append(DateTimeValidator())
+        self.validators.append(DateTimeValidator.shared())
 
 
 class SlugProperty(StringProperty):
@@ -241,7 +606,7 @@ class SlugProperty(StringProperty):
         Initialize the validators for the SlugProperty.
         """
         super().get_validators()
-        self.validators.append(SlugValidator())
+        self.validators.append(SlugValidator.shared())
 
     def get_python_value(self, value: Any) -> Optional[str]:
         """
@@ -270,7 +635,7 @@ class EmailProperty(BaseProperty):
         Initialize the validators for the EmailProperty.
         """
         super().get_validators()
-        self.validators.append(EmailValidator())
+        self.validators.append(EmailValidator.shared())
 
 
 class DictProperty(BaseProperty):
@@ -285,7 +650,7 @@ class DictProperty(BaseProperty):
         Initialize the validators for the DictProperty.
         """
         super().get_validators()
-        self.validators.append(DictValidator())
+        self.validators.append(DictValidator.shared())
 
 
 class ListProperty(BaseProperty):
@@ -300,7 +665,7 @@ class ListProperty(BaseProperty):
         Initialize the validators for the ListProperty.
         """
         super().get_validators()
-        self.validators.append(ListValidator())
+        self.validators.append(ListValidator.shared())
 
 
 class ForeignProperty(BaseProperty):
@@ -325,7 +690,7 @@ class ForeignProperty(BaseProperty):
         Get validators for the foreign property, adding ForeignValidator to the list.
         """
         super().get_validators()
-        self.validators.insert(0, ForeignValidator(self.foreign_class))
+        self.validators.insert(0, ForeignValidator.shared(self.foreign_class))
 
     def get_db_value(self, value: Any) -> Any:
         """
@@ -342,10 +707,12 @@ class ForeignProperty(BaseProperty):
         if self.return_type == 'single':
             if not self.return_prop:
                 raise ValueError('ForeignProperty requires the return_prop argument if return_type is "single"')
-            return value._data[self.return_prop]
+            return value.to_dict()[self.return_prop]
         if self.return_type == 'dict':
-            return value._data
+            return value.to_dict()
         if self.return_type == 'json':
+            import json
+            from valley.utils.json_utils import ValleyEncoder
             return json.dumps(value, cls=ValleyEncoder)
         else:
             return value
@@ -368,7 +735,7 @@ class ForeignListProperty(ListProperty):
         Get validators for the foreign list property, adding ForeignListValidator to the list.
         """
         super().get_validators()
-        self.validators.insert(len(self.validators), ForeignListValidator(self.foreign_class))
+        self.validators.insert(len(self.validators), ForeignListValidator.shared(self.foreign_class))
 
     def get_db_value(self, value: Any) -> Any:
         """
@@ -383,8 +750,10 @@ class ForeignListProperty(ListProperty):
         if not value:
             return None
         if self.return_type == 'list':
-            return [obj._data for obj in value]
+            return [obj.to_dict() for obj in value]
         if self.return_type == 'json':
+            import json
+            from valley.utils.json_utils import ValleyEncoder
             return json.dumps(value, cls=ValleyEncoder)
         else:
             return value
@@ -1,12 +1,81 @@
-import json
-from typing import Any, Dict
+import sys
+from types import FunctionType, MemberDescriptorType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 from valley.declarative import DeclaredVars as DV, \
     DeclarativeVariablesMetaclass as DVM
-from valley.exceptions import ValidationException
+from valley.exceptions import ErrorCode, ValidationException
 from valley.properties import BaseProperty
 
 
+class ValidationBatch(NamedTuple):
+    """
+    The result of validating many rows at once.
+
+    Attributes:
+        valid (List[Dict[str, Any]]): The cleaned data of every valid row, in input order.
+        error_codes (Dict[int, Dict[str, ErrorCode]]): The errors of every invalid row, keyed by the row's input index.
+    """
+    valid: List[Dict[str, Any]]
+    error_codes: Dict[int, Dict[str, ErrorCode]]
+
+    @property
+    def errors(self) -> Dict[int, Dict[str, str]]:
+        """
+        The error messages of every invalid row, keyed by the row's input index.
+
+        The messages are rendered from ``error_codes`` on every access.
+        """
+        return {index: render_errors(codes) for index, codes in self.error_codes.items()}
+
+
+def render_errors(error_codes: Dict[str, ErrorCode]) -> Dict[str, str]:
+    """
+    Renders error codes into error messages.
+
+    Args:
+        error_codes (Dict[str, ErrorCode]): The error codes keyed by property name.
+
+    Returns:
+        Dict[str, str]: The error messages keyed by property name.
+    """
+    return {key: error.message(key) for key, error in error_codes.items()}
+
+
+def _python_value(prop: BaseProperty, value: Any) -> Any:
+    try:
+        return prop.get_python_value(value)
+    except ValueError:
+        return value
+
+
+def _call_hook(hook: Callable, instance: 'BaseSchema', value: Any) -> Optional[ErrorCode]:
+    try:
+        hook(instance, value)
+    except ValidationException as e:
+        return ErrorCode.from_exception(e)
+    return None
+
+
+def depends_on(*keys: str) -> Callable[[Callable], Callable]:
+    """
+    Declares the other properties a ``{key}_validate`` hook reads.
+
+    Schemas with ``_incremental_validation`` re-run the hook's field whenever one of
+    these properties changes, not only when the field itself changes.
+
+    Args:
+        *keys (str): The keys of the properties the hook depends on.
+
+    Returns:
+        Callable: A decorator for the hook.
+    """
+    def decorator(hook: Callable) -> Callable:
+        hook._depends_on = frozenset(keys)
+        return hook
+    return decorator
+
+
 class BaseSchema:
     """
     Base class for all Valley Schema classes.
@@ -15,10 +84,26 @@ class BaseSchema:
 
     Attributes:
         _data (Dict[str, Any]): Stores the data associated with the schema's properties.
-        _errors (Dict[str, str]): Stores any validation errors.
+        _errors (Dict[str, str]): Stores any validation errors, rendered from _error_codes when first read.
+        _error_codes (Dict[str, ErrorCode]): Stores the validation errors as error codes.
         _is_valid (bool): Indicates whether the schema is valid.
         cleaned_data (Dict[str, Any]): Stores the cleaned data after validation.
     """
+    __slots__ = ()
+    _use_slots: bool = False
+    _incremental_validation: bool = False
+    _adaptive_validator_order: bool = False
+    # Store the values parsed during validation, e.g. integers for '42', in cleaned_data
+    _coerce_values: bool = False
+    # Keys changed since the last complete validation, or None if there was none
+    _dirty: Optional[Set[str]] = None
+    # Per-instance results of the default factories, filled in as they are called
+    _defaults: Optional[Dict[str, Any]] = None
+    # Whether properties with dynamic defaults may still be missing from _data
+    _defaults_pending: bool = False
+    # Per-instance attributes that slotted schemas reserve a slot for
+    _instance_slots: Tuple[str, ...] = ('_error_codes', '_error_messages', '_is_valid', 'cleaned_data',
+                                        '_defaults', '_defaults_pending')
 
     def __init__(self, **kwargs: Any) -> None:
         """
@@ -28,33 +113,147 @@ class BaseSchema:
             **kwargs: Arbitrary keyword arguments that represent the schema properties.
         """
         self._data: Dict[str, Any] = {}
-        self._errors: Dict[str, str] = {}
+        self._error_codes: Dict[str, ErrorCode] = {}
+        self._error_messages: Optional[Dict[str, str]] = None
         self._is_valid: bool = False
         self.cleaned_data: Dict[str, Any] = {}
+        self._defaults = None
         self._init_schema(kwargs)
 
-    def _init_schema(self, kwargs: Dict[str, Any]) -> None:
+    @classmethod
+    def _new_instance(cls) -> 'BaseSchema':
+        """
+        Creates an instance without data and validation results, without running __init__.
+
+        Returns:
+            BaseSchema: The new instance.
+        """
+        instance = cls.__new__(cls)
+        instance._error_codes = {}
+        instance._error_messages = None
+        instance._is_valid = False
+        instance.cleaned_data = {}
+        instance._defaults = None
+        instance._defaults_pending = False
+        return instance
+
+    def _init_schema(self, kwargs: Dict[str, Any], partial: bool = False) -> None:
         """
         Initializes schema properties with provided values or default values.
 
+        Properties with dynamic defaults that are missing from kwargs are filled in when
+        they are first read, validated or serialized.
+
         Args:
             kwargs (Dict[str, Any]): The keyword arguments for schema properties.
+            partial (bool, optional): Leave out the properties missing from kwargs instead of using their defaults.
         """
-        for key, prop in self._base_properties.items():
-            value = kwargs.get(key, prop.get_default_value())
-            try:
-                self._data[key] = prop.get_python_value(value)
-            except ValueError:
-                self._data[key] = value
+        self._defaults_pending = not partial and not self._get_defaults()[1].issubset(kwargs)
+        self._data = self._build_data(kwargs, partial)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'BaseSchema':
+        """
+        Creates an instance backed by data that is already known to be valid, e.g. rows read back from a database.
+
+        The dictionary is adopted as ``_data`` as-is: it is not copied, no defaults are filled
+        in and no values are converted, so later assignments change it. Properties are read
+        from it on access, and missing properties read as None. Since the values read are
+        cached, change it through the instance or ``_data`` afterwards rather than through
+        the original reference. Slotted schemas copy the values into their slots without
+        converting them.
 
-        for i in self.BUILTIN_DOC_ATTRS:
+        Args:
+            data (Dict[str, Any]): The values of the schema properties.
+
+        Returns:
+            BaseSchema: The new, not yet validated, instance.
+        """
+        instance = cls._new_instance()
+        instance._init_trusted(data)
+        return instance
+
+    def _init_trusted(self, data: Dict[str, Any]) -> None:
+        """
+        Adopts already validated data as the backing store of the instance.
+
+        Args:
+            data (Dict[str, Any]): The values of the schema properties.
+        """
+        self._data = data
+
+    @classmethod
+    def _get_defaults(cls) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+        """
+        Returns the defaults of the class, computing them on first use.
+
+        Static defaults are computed and converted to Python values once per property. Dynamic
+        defaults, such as callables, are computed per instance when they are needed.
+        Call _compile_defaults() again if properties are changed after the class is created.
+
+        Returns:
+            Tuple[Dict[str, Any], FrozenSet[str]]: The Python values of the static defaults and the
+            keys of the properties with dynamic defaults.
+        """
+        defaults = cls.__dict__.get('_default_values')
+        if defaults is None:
+            defaults = cls._compile_defaults()
+        return defaults
+
+    @classmethod
+    def _compile_defaults(cls) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+        """
+        Computes the static defaults of the class and finds the properties with dynamic defaults.
+
+        Returns:
+            Tuple[Dict[str, Any], FrozenSet[str]]: See _get_defaults().
+        """
+        static = {}
+        dynamic = set()
+        for key, prop in cls._base_properties.items():
+            if prop.has_dynamic_default():
+                dynamic.add(key)
+            else:
+                static[key] = _python_value(prop, prop.get_default_value())
+        cls._default_values = defaults = (static, frozenset(dynamic))
+        return defaults
+
+    @classmethod
+    def _build_data(cls, kwargs: Dict[str, Any], partial: bool = False) -> Dict[str, Any]:
+        """
+        Builds the data dictionary for the given values, filling in static defaults and converting them to Python values.
+
+        Properties with dynamic defaults are left out if they are missing from kwargs;
+        see _materialize_defaults().
+
+        Args:
+            kwargs (Dict[str, Any]): The values for the schema properties.
+            partial (bool, optional): Leave out the properties missing from kwargs instead of using their defaults.
+
+        Returns:
+            Dict[str, Any]: The data dictionary.
+        """
+        static_defaults = cls._get_defaults()[0]
+        data = {}
+        for key, prop in cls._base_properties.items():
+            if key in kwargs:
+                data[key] = _python_value(prop, kwargs[key])
+            elif not partial and key in static_defaults:
+                data[key] = static_defaults[key]
+
+        for i in cls.BUILTIN_DOC_ATTRS:
             if i in kwargs:
-                self._data[i] = kwargs[i]
+                data[i] = kwargs[i]
+        return data
 
     def __getattr__(self, name: str) -> Any:
         """
         Provides dynamic access to schema properties.
 
+        The Python value of a property is cached in the instance dictionary on first access,
+        so later reads do not reach this method. Assigning the property, or reading or
+        replacing ``_data``, drops the cached value.
+
         Args:
             name (str): The name of the attribute.
 
@@ -64,56 +263,768 @@ class BaseSchema:
         Raises:
             AttributeError: If the attribute is not a schema property.
         """
-        if name in self._base_properties:
-            return self._base_properties[name].get_python_value(self._data.get(name))
+        prop = self._base_properties.get(name)
+        if prop is not None:
+            data = self.__dict__['_data']
+            if self._defaults_pending and name not in data and name in self._get_defaults()[1]:
+                return self._materialize_default(name)
+            value = self.__dict__[name] = prop.get_python_value(data.get(name))
+            return value
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
     def __setattr__(self, name: str, value: Any) -> None:
         """
         Sets the value for a schema property or a regular attribute.
 
+        The value of a schema property is stored as-is in ``_data`` for validation,
+        and its cached Python value is dropped.
+
         Args:
             name (str): The name of the attribute.
             value (Any): The value to set for the attribute.
         """
         if name in self._base_properties:
-            self._data[name] = value
+            instance_dict = self.__dict__
+            instance_dict['_data'][name] = value
+            instance_dict.pop(name, None)
+            if self._dirty is not None:
+                self._dirty.add(name)
         else:
             super().__setattr__(name, value)
 
-    def validate(self) -> None:
+    @property
+    def _data(self) -> Dict[str, Any]:
+        """
+        The values of the schema properties, as assigned.
+
+        The returned dictionary may be changed directly, so reading it drops the cached
+        Python values of the properties. Use _current_data() to only read it.
+        """
+        self._drop_cached_values()
+        return self.__dict__['_data']
+
+    @_data.setter
+    def _data(self, data: Dict[str, Any]) -> None:
+        self._drop_cached_values()
+        self.__dict__['_data'] = data
+
+    def _current_data(self) -> Dict[str, Any]:
+        """
+        Returns _data for reading, without dropping the cached Python values.
+
+        Returns:
+            Dict[str, Any]: The values of the schema properties. It must not be changed.
+        """
+        return self.__dict__['_data']
+
+    def _drop_cached_values(self) -> None:
+        """
+        Drops the Python values that __getattr__ cached in the instance dictionary.
+        """
+        instance_dict = self.__dict__
+        for key in instance_dict.keys() & self._base_properties.keys():
+            del instance_dict[key]
+
+    @property
+    def _errors(self) -> Dict[str, str]:
+        messages = self._error_messages
+        if messages is None:
+            messages = self._error_messages = render_errors(self._error_codes)
+        return messages
+
+    @_errors.setter
+    def _errors(self, errors: Dict[str, str]) -> None:
+        self._error_codes = {key: ErrorCode.from_message(msg) for key, msg in errors.items()}
+        self._error_messages = errors
+
+    def _default_value(self, key: str) -> Any:
+        """
+        Returns the default of a property, calling a default factory at most once per instance.
+
+        Args:
+            key (str): The property key.
+
+        Returns:
+            Any: The default value, before conversion to a Python value.
+        """
+        defaults = self._defaults
+        if defaults is None:
+            defaults = self._defaults = {}
+        if key in defaults:
+            return defaults[key]
+        value = defaults[key] = self._base_properties[key].get_default_value()
+        return value
+
+    def _checked_value(self, key: str, value: Any) -> Any:
+        """
+        Returns the value that the validators of a property with a dynamic default check.
+
+        Like the checks compiled with ``substitute_default``, falsy values are replaced
+        by the default unless it is None, but the instance's own default is used.
+
+        Args:
+            key (str): The property key.
+            value (Any): The value of the property.
+
+        Returns:
+            Any: The value to check.
+        """
+        if not value:
+            default = self._default_value(key)
+            if default is not None:
+                return default
+        return value
+
+    def _materialize_default(self, key: str) -> Any:
+        """
+        Fills in the dynamic default of a property missing from _data.
+
+        Args:
+            key (str): The property key.
+
+        Returns:
+            Any: The Python value of the default.
+        """
+        instance_dict = self.__dict__
+        value = instance_dict['_data'][key] = instance_dict[key] = _python_value(self._base_properties[key],
+                                                                                 self._default_value(key))
+        return value
+
+    def _materialize_defaults(self) -> None:
+        """
+        Fills in the dynamic defaults of all properties still missing from _data.
+        """
+        data = self.__dict__['_data']
+        for key in self._get_defaults()[1]:
+            if key not in data:
+                self._materialize_default(key)
+        self._defaults_pending = False
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Returns the state to pickle, which is the instance dictionary holding _data and the validation results.
+
+        Returns:
+            Dict[str, Any]: The instance state.
+        """
+        if self._defaults_pending:
+            self._materialize_defaults()
+        return self.__dict__
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores a pickled instance without running __init__ or falling back to __getattr__.
+
+        Args:
+            state (Dict[str, Any]): The instance state.
+        """
+        self.__dict__.update(state)
+
+    def validate(self, full: bool = False, fail_fast: bool = False,
+                 fields: Optional[Iterable[str]] = None) -> Optional[Tuple[str, str]]:
         """
         Validates the schema properties against their defined constraints.
 
         This method updates the _is_valid flag and populates the cleaned_data attribute.
+
+        With ``fail_fast``, validation stops at the first invalid property and returns its
+        key and error message instead of raising or collecting the remaining errors.
+
+        If the class sets ``_coerce_values``, each value is parsed once during validation,
+        the constraint validators check the parsed value and cleaned_data holds the parsed
+        values, e.g. ``42`` for ``'42'`` or a ``datetime.date`` for ``'2017-01-10'``.
+
+        If the class sets ``_incremental_validation``, only the properties assigned since
+        the last complete validation, and the fields whose hooks depend on them, are
+        validated again; the earlier results are kept for everything else. Changes made
+        directly to ``_data`` are not tracked, so pass ``full=True`` after making them.
+
+        With ``fields``, only those properties are validated, along with the hooks of the
+        fields that depend on them; see validate_partial().
+
+        Args:
+            full (bool, optional): Validate every property even if earlier results could be reused.
+            fail_fast (bool, optional): Stop at the first invalid property, regardless of _create_error_dict.
+            fields (Optional[Iterable[str]], optional): The keys of the properties to validate.
+
+        Returns:
+            Optional[Tuple[str, str]]: With ``fail_fast``, the key and message of the first error, or None
+            if the schema is valid. Otherwise None.
+
+        Raises:
+            TypeError: If the schema has coroutine validators or hooks, which only avalidate() awaits.
         """
-        self._errors = {}
-        data = self._data.copy()
+        self._require_sync()
+        if fields is not None:
+            return self._validate_fields(fields, fail_fast)
+        if fail_fast:
+            return self._validate_fail_fast()
+        if self._defaults_pending:
+            self._materialize_defaults()
+        data = self._current_data().copy()
+        plan = self._with_instance_hooks(self._get_validation_plan())
+        dynamic = self._get_defaults()[1]
+        dirty = self._dirty
+        previous_errors = self._error_codes
+        previous_data = self.cleaned_data
+        self._error_codes = {}
+        self._error_messages = None
+        if dirty is not None:
+            # Until this pass completes, the earlier results cannot be trusted
+            self._dirty = None
+
+        coerce = self._coerce_values
+        if dirty is None or full:
+            for key, check, hook in plan:
+                value = data.get(key)
+                checked = self._checked_value(key, value) if dynamic and key in dynamic else value
+                if coerce:
+                    value, error = check(checked)
+                    data[key] = value
+                else:
+                    error = check(checked)
+                if error is None and hook is not None:
+                    error = _call_hook(hook, self, value)
+                if error is not None:
+                    self._handle_error_code(key, error)
+        else:
+            recheck = set(dirty)
+            for key in dirty:
+                recheck.update(self._hook_dependents.get(key, ()))
+            for key, check, hook in plan:
+                if key not in recheck:
+                    if key in previous_errors:
+                        self._error_codes[key] = previous_errors[key]
+                    if coerce and key in previous_data:
+                        data[key] = previous_data[key]
+                    continue
+                value = data.get(key)
+                checked = self._checked_value(key, value) if dynamic and key in dynamic else value
+                if coerce:
+                    value, error = check(checked)
+                    data[key] = value
+                else:
+                    error = check(checked)
+                if error is None and hook is not None:
+                    error = _call_hook(hook, self, value)
+                if error is not None:
+                    self._handle_error_code(key, error)
 
-        for key, prop in self._base_properties.items():
+        self._is_valid = not bool(self._error_codes)
+        self.cleaned_data = data
+        if self._incremental_validation:
+            if dirty is None:
+                dirty = set()
+            dirty.clear()
+            self._dirty = dirty
+
+    def _validate_fail_fast(self) -> Optional[Tuple[str, str]]:
+        """
+        Validates the schema properties until the first error.
+
+        Returns:
+            Optional[Tuple[str, str]]: The key and message of the first error, or None if the schema is valid.
+        """
+        if self._defaults_pending:
+            self._materialize_defaults()
+        data = self._current_data().copy()
+        if self._dirty is not None:
+            self._dirty = None
+        self.cleaned_data = data
+        self._error_messages = None
+
+        coerce = self._coerce_values
+        dynamic = self._get_defaults()[1]
+        for key, check, hook in self._with_instance_hooks(self._get_validation_plan()):
             value = data.get(key)
-            prop_validate = getattr(self, f'{key}_validate', None)
+            checked = self._checked_value(key, value) if dynamic and key in dynamic else value
+            if coerce:
+                value, error = check(checked)
+                data[key] = value
+            else:
+                error = check(checked)
+            if error is None and hook is not None:
+                error = _call_hook(hook, self, value)
+            if error is not None:
+                self._is_valid = False
+                self._error_codes = {key: error}
+                return key, error.message(key)
+
+        self._is_valid = True
+        self._error_codes = {}
+        if self._incremental_validation:
+            self._dirty = set()
+        return None
 
+    def _validate_fields(self, fields: Iterable[str], fail_fast: bool = False) -> Optional[Tuple[str, str]]:
+        """
+        Validates the given properties and the hooks of the fields that depend on them.
+
+        The hooks of dependent fields are called with the fields' current values, but their
+        properties are not validated. Only the errors and the values of the given properties
+        end up in _error_codes and cleaned_data, and the dynamic defaults of other properties
+        are not computed.
+
+        Args:
+            fields (Iterable[str]): The keys of the properties to validate.
+            fail_fast (bool, optional): Stop at the first invalid property, regardless of _create_error_dict.
+
+        Returns:
+            Optional[Tuple[str, str]]: With ``fail_fast``, the key and message of the first error, or None.
+        """
+        keys = set(fields)
+        plan = self._with_instance_hooks(self._get_validation_plan())
+        dependents = set()
+        for key in keys:
+            dependents.update(self._hook_dependents.get(key, ()))
+        if self._defaults_pending:
+            # Only the fields that are validated get their defaults; reading a property fills its default in
+            for key in self._get_defaults()[1].intersection(keys | dependents):
+                getattr(self, key)
+        data = self._current_data().copy()
+        if self._dirty is not None:
+            # Results of the other fields are dropped, so the next validation has to be complete
+            self._dirty = None
+        self._error_codes = {}
+        self._error_messages = None
+        self.cleaned_data = cleaned_data = {}
+
+        coerce = self._coerce_values
+        dynamic = self._get_defaults()[1]
+        for key, check, hook in plan:
+            value = data.get(key)
+            if key in keys:
+                checked = self._checked_value(key, value) if dynamic and key in dynamic else value
+                if coerce:
+                    value, error = check(checked)
+                else:
+                    error = check(checked)
+                cleaned_data[key] = value
+                if error is None and hook is not None:
+                    error = _call_hook(hook, self, value)
+            elif key in dependents and hook is not None:
+                error = _call_hook(hook, self, value)
+            else:
+                continue
+            if error is None:
+                continue
+            if fail_fast:
+                self._is_valid = False
+                self._error_codes = {key: error}
+                return key, error.message(key)
+            self._handle_error_code(key, error)
+        self._is_valid = not bool(self._error_codes)
+        return None
+
+    @classmethod
+    def validate_partial(cls, data: Dict[str, Any], required: bool = False) -> 'BaseSchema':
+        """
+        Creates and validates an instance holding only the given values, e.g. the body of a PATCH request.
+
+        Missing properties are neither defaulted nor validated; reading them returns None.
+        Only the given properties are validated, along with the hooks of the fields that
+        depend on them, and cleaned_data holds only the given values.
+
+        Args:
+            data (Dict[str, Any]): The values of the properties to validate.
+            required (bool, optional): Also validate the required properties missing from ``data``,
+                so that they are reported as missing.
+
+        Returns:
+            BaseSchema: The validated instance.
+        """
+        instance = cls._new_instance()
+        instance._init_schema(data, partial=True)
+        fields = [key for key in data if key in cls._base_properties]
+        if required:
+            fields.extend(key for key, prop in cls._base_properties.items() if prop.required and key not in data)
+        instance.validate(fields=fields)
+        return instance
+
+    async def avalidate(self, concurrency: Optional[int] = None) -> None:
+        """
+        Validates the schema properties, awaiting coroutine validators and ``{key}_validate`` hooks.
+
+        Fields with coroutine validators or hooks are validated concurrently; all other
+        fields are validated synchronously. Schemas without any coroutine validators or
+        hooks are validated exactly like validate().
+
+        Args:
+            concurrency (Optional[int], optional): The maximum number of fields awaited at the same time.
+                Defaults to no limit.
+        """
+        async_plan = self._get_async_plan()
+        if async_plan is None:
+            return self.validate()
+        async_plan = self._with_instance_hooks(async_plan)
+
+        if self._dirty is not None:
+            self._dirty = None
+        if self._defaults_pending:
+            self._materialize_defaults()
+        data = self._current_data().copy()
+        dynamic = self._get_defaults()[1]
+        import asyncio
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+        outcomes: List[Optional[ErrorCode]] = [None] * len(async_plan)
+
+        async def run_field(index: int, key: str, prop: BaseProperty, hook: Optional[Callable],
+                            value: Any, checked: Any) -> None:
             try:
-                prop.validate(value, key)
-                if callable(prop_validate):
-                    prop_validate(value)
+                if semaphore is None:
+                    await self._avalidate_field(key, prop, hook, value, checked)
+                else:
+                    async with semaphore:
+                        await self._avalidate_field(key, prop, hook, value, checked)
             except ValidationException as e:
-                self._handle_validation_error(key, e)
+                outcomes[index] = ErrorCode.from_exception(e)
+
+        coerce = self._coerce_values
+        pending = []
+        for index, (key, check, hook, prop) in enumerate(async_plan):
+            value = data.get(key)
+            checked = self._checked_value(key, value) if dynamic and key in dynamic else value
+            if prop is not None:
+                pending.append(run_field(index, key, prop, hook, value, checked))
+                continue
+            if coerce:
+                value, error = check(checked)
+                data[key] = value
+            else:
+                error = check(checked)
+            if error is None and hook is not None:
+                error = _call_hook(hook, self, value)
+            outcomes[index] = error
+        await asyncio.gather(*pending)
 
-        self._is_valid = not bool(self._errors)
+        self._error_codes = {}
+        self._error_messages = None
+        for (key, _, _, prop), error in zip(async_plan, outcomes):
+            if error is not None:
+                self._handle_error_code(key, error)
+            elif coerce and prop is not None:
+                value = data.get(key)
+                data[key] = prop.coerce(self._checked_value(key, value) if key in dynamic else value)
+        self._is_valid = not bool(self._error_codes)
         self.cleaned_data = data
+        if self._incremental_validation:
+            self._dirty = set()
+
+    async def _avalidate_field(self, key: str, prop: BaseProperty, hook: Optional[Callable],
+                               value: Any, checked: Any) -> None:
+        import inspect
+        await prop.avalidate(checked, key)
+        if hook is not None:
+            result = hook(self, value)
+            if inspect.isawaitable(result):
+                await result
+
+    @classmethod
+    def validate_many(cls, rows: Iterable[Dict[str, Any]]) -> ValidationBatch:
+        """
+        Validates many rows of plain dictionaries without creating a schema instance per row.
+
+        Each row is treated exactly as if it were passed to the constructor and validated,
+        except that errors are always collected, regardless of _create_error_dict.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): The rows to validate.
+
+        Returns:
+            ValidationBatch: The cleaned data of the valid rows and the error codes of the invalid ones.
+        """
+        validate_row = cls._make_row_validator()
+        valid = []
+        error_codes = {}
+        for index, row in enumerate(rows):
+            data, row_errors = validate_row(row)
+            if row_errors is None:
+                valid.append(data)
+            else:
+                error_codes[index] = row_errors
+        return ValidationBatch(valid, error_codes)
+
+    @classmethod
+    def _make_row_validator(cls) -> Callable[[Dict[str, Any]], Tuple[Dict[str, Any], Optional[Dict[str, ErrorCode]]]]:
+        """
+        Creates a function that validates one plain dictionary at a time.
+
+        Hooks are instance methods, so the function reuses a single instance for every row.
+
+        Returns:
+            Callable: A function returning the row's data and its error codes, or None if the row is valid.
+
+        Raises:
+            TypeError: If the schema has coroutine validators or hooks.
+        """
+        cls._require_sync()
+        plan = cls._get_validation_plan()
+        build_data = cls._build_data
+        coerce = cls._coerce_values
+        dynamic = cls._get_defaults()[1]
+        properties = cls._base_properties
+        cursor = cls._new_instance()
+
+        def validate_row(row: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Dict[str, ErrorCode]]]:
+            data = build_data(row)
+            if dynamic:
+                # Every row gets its own defaults
+                cursor._defaults = None
+                for key in dynamic:
+                    if key not in data:
+                        data[key] = _python_value(properties[key], cursor._default_value(key))
+            cursor._data = data
+            row_errors = None
+            for key, check, hook in plan:
+                value = data.get(key)
+                checked = cursor._checked_value(key, value) if dynamic and key in dynamic else value
+                if coerce:
+                    value, error = check(checked)
+                    data[key] = value
+                else:
+                    error = check(checked)
+                if error is None and hook is not None:
+                    error = _call_hook(hook, cursor, value)
+                if error is not None:
+                    if row_errors is None:
+                        row_errors = {}
+                    row_errors[key] = error
+            return data, row_errors
+        return validate_row
+
+    @classmethod
+    def _get_validation_plan(cls) -> Tuple[Tuple[str, Callable[[Any], Optional[ErrorCode]], Optional[Callable]], ...]:
+        """
+        Returns the compiled validation plan for the class, building it on first use.
+
+        Returns:
+            tuple: One ``(key, check, hook)`` entry per schema property.
+        """
+        plan = cls.__dict__.get('_validation_plan')
+        if plan is None:
+            plan = cls._compile_validation_plan()
+        return plan
+
+    @classmethod
+    def _compile_validation_plan(cls) -> Tuple[Tuple[str, Callable[[Any], Optional[ErrorCode]], Optional[Callable]], ...]:
+        """
+        Compiles the properties and ``{key}_validate`` hooks of the class into a flat validation plan.
+
+        Call this again if properties, validators or hooks are changed after the class is created.
+        The checks are instrumented while valley.instrument is enabled.
+        With ``_coerce_values``, ``check`` is the property's compile_coerce() function and
+        returns the parsed value along with the error.
+
+        Returns:
+            tuple: One ``(key, check, hook)`` entry per schema property.
+        """
+        analysis = cls._analyze_validation_plan()
+
+        # valley.instrument can only be enabled once it has been imported
+        instrument = sys.modules.get('valley.instrument')
+        schema_stats = instrument.schema_stats(cls) if instrument is not None and instrument.is_enabled() else None
+        # The dynamic defaults are substituted by the instance, which calls their factories only once
+        dynamic = cls._get_defaults()[1]
+        plan = []
+        async_plan = []
+        hook_dependents: Dict[str, Set[str]] = {}
+        for key, hook_kind, is_async, depends_on in analysis:
+            prop = cls._base_properties[key]
+            field_stats = schema_stats.child(key) if schema_stats is not None else None
+            wrap = instrument.validator_wrapper(field_stats) if field_stats is not None else None
+            if cls._coerce_values:
+                check = prop.compile_coerce(key, adaptive=cls._adaptive_validator_order, wrap=wrap,
+                                            substitute_default=key not in dynamic)
+            else:
+                check = prop.compile_check(key, adaptive=cls._adaptive_validator_order, wrap=wrap,
+                                           substitute_default=key not in dynamic)
+            if field_stats is not None:
+                check = instrument.wrap_field(field_stats, check, cls._coerce_values)
+            hook = cls._make_validation_hook(key, hook_kind)
+            if field_stats is not None and hook is not None and not is_async:
+                hook = instrument.wrap_hook(field_stats, hook)
+            plan.append((key, check, hook))
+            async_plan.append((key, check, hook, prop if is_async else None))
+            for dependency in depends_on:
+                hook_dependents.setdefault(dependency, set()).add(key)
+
+        cls._hook_dependents = {key: frozenset(keys) for key, keys in hook_dependents.items()}
+        cls._hook_names = frozenset(f'{key}_validate' for key in cls._base_properties)
+
+        cls._async_plan = tuple(async_plan) if any(entry[3] for entry in async_plan) else None
+        cls._validation_plan = plan = tuple(plan)
+        return plan
+
+    def _with_instance_hooks(self, plan: tuple) -> tuple:
+        """
+        Replaces the hooks of a compiled plan with the ``{key}_validate`` hooks set on the instance itself.
+
+        The plan only holds the hooks of the class, so this keeps hooks assigned to an
+        instance, e.g. ``obj.name_validate = fn``, working. Such hooks are called synchronously.
+
+        Args:
+            plan (tuple): The validation plan or asynchronous plan of the class.
+
+        Returns:
+            tuple: The plan, or a copy of it with the instance's hooks.
+        """
+        instance_dict = getattr(self, '__dict__', None)
+        if not instance_dict or self._hook_names.isdisjoint(instance_dict):
+            return plan
+        entries = []
+        for entry in plan:
+            name = f'{entry[0]}_validate'
+            if name in instance_dict:
+                hook = instance_dict[name]
+                hook = (lambda instance, value, hook=hook: hook(value)) if callable(hook) else None
+                entry = entry[:2] + (hook,) + entry[3:]
+            entries.append(entry)
+        return tuple(entries)
+
+    @classmethod
+    def _require_sync(cls) -> None:
+        """
+        Makes sure the schema can be validated synchronously.
+
+        Raises:
+            TypeError: If the schema has coroutine validators or hooks, which would never be awaited.
+        """
+        if cls._get_async_plan() is not None:
+            raise TypeError(f'{cls.__name__} has coroutine validators or hooks, '
+                            'so it must be validated with avalidate().')
+
+    @classmethod
+    def _get_async_plan(cls) -> Optional[Tuple[Tuple[str, Callable[[Any], Optional[ErrorCode]], Optional[Callable],
+                                                     Optional[BaseProperty]], ...]]:
+        """
+        Returns the asynchronous validation plan for the class, or None if it has no coroutine validators or hooks.
+
+        Returns:
+            Optional[tuple]: One ``(key, check, hook, prop)`` entry per schema property, where ``prop``
+            is only set for fields that have to be awaited.
+        """
+        cls._get_validation_plan()
+        return cls.__dict__['_async_plan']
+
+    @classmethod
+    def _analyze_validation_plan(cls) -> List[Tuple[str, Optional[str], bool, Tuple[str, ...]]]:
+        """
+        Inspects the properties and ``{key}_validate`` hooks of the class.
+
+        Returns:
+            list: One ``(key, hook_kind, is_async, depends_on)`` entry per schema property,
+            where ``hook_kind`` is the result of _validation_hook_kind().
+        """
+        analysis = []
+        for key, prop in cls._base_properties.items():
+            raw_hook = getattr(cls, f'{key}_validate', None)
+            is_async = prop.is_async
+            if not is_async and raw_hook is not None:
+                import inspect
+                is_async = inspect.iscoroutinefunction(raw_hook)
+            analysis.append((key, cls._validation_hook_kind(key), is_async,
+                             tuple(getattr(raw_hook, '_depends_on', ()))))
+        return analysis
+
+    @classmethod
+    def _validation_hook_kind(cls, key: str) -> Optional[str]:
+        """
+        Determines how the ``{key}_validate`` hook is called.
+
+        Args:
+            key (str): The property key.
+
+        Returns:
+            Optional[str]: ``'function'`` for plain functions, which are called directly,
+            ``'bound'`` for other callables, which are looked up on the instance, or None
+            if the class does not define a hook.
+        """
+        name = f'{key}_validate'
+        # Look the hook up without invoking descriptors, like inspect.getattr_static() but cheaper
+        for klass in cls.__mro__:
+            if name in klass.__dict__:
+                hook = klass.__dict__[name]
+                break
+        else:
+            return None
+        if isinstance(hook, FunctionType):
+            return 'function'
+        if not callable(getattr(cls, name, None)):
+            return None
+        return 'bound'
+
+    @classmethod
+    def _make_validation_hook(cls, key: str, hook_kind: Optional[str]) -> Optional[Callable[['BaseSchema', Any], None]]:
+        """
+        Creates a function taking ``(instance, value)`` that calls the ``{key}_validate`` hook.
+
+        Args:
+            key (str): The property key.
+            hook_kind (Optional[str]): The result of _validation_hook_kind() for the key.
+
+        Returns:
+            Optional[Callable]: The hook or None if the class does not define one.
+        """
+        name = f'{key}_validate'
+        if hook_kind == 'function':
+            for klass in cls.__mro__:
+                if name in klass.__dict__:
+                    return klass.__dict__[name]
+        if hook_kind is None:
+            return None
+
+        def bound_hook(instance: 'BaseSchema', value: Any) -> None:
+            getattr(instance, name)(value)
+        return bound_hook
+
+    @classmethod
+    def _resolve_validation_hook(cls, key: str) -> Optional[Callable[['BaseSchema', Any], None]]:
+        """
+        Resolves the ``{key}_validate`` hook into a function taking ``(instance, value)``.
+
+        Args:
+            key (str): The property key.
+
+        Returns:
+            Optional[Callable]: The hook or None if the class does not define one.
+        """
+        return cls._make_validation_hook(key, cls._validation_hook_kind(key))
+
+    def _handle_error_code(self, key: str, error: ErrorCode) -> None:
+        """
+        Handles an error returned by property validation, without building an exception unless one is needed.
+
+        Subclasses that override _handle_validation_error() get the error as an exception.
+
+        Args:
+            key (str): The property key associated with the validation error.
+            error (ErrorCode): The error returned by property validation.
+
+        Raises:
+            ValidationException: If the schema does not create an error dictionary. Exceptions raised
+            by validators and hooks are raised as-is.
+        """
+        if type(self)._handle_validation_error is not BaseSchema._handle_validation_error:
+            self._handle_validation_error(key, error.to_exception(key))
+        elif self._create_error_dict:
+            self._error_codes[key] = error
+        else:
+            raise error.to_exception(key)
 
     def _handle_validation_error(self, key: str, error: ValidationException) -> None:
         """
-        Handles validation errors either by raising them or storing them in the _errors dictionary.
+        Handles validation errors either by raising them or storing them in the _error_codes dictionary.
 
         Args:
             key (str): The property key associated with the validation error.
             error (ValidationException): The validation exception raised during property validation.
+
+        Raises:
+            ValidationException: If the schema does not create an error dictionary.
         """
         if self._create_error_dict:
-            self._errors[key] = error.error_msg
+            self._error_codes[key] = ErrorCode.from_exception(error)
+            self._error_messages = None
         else:
             raise error
 
@@ -124,16 +1035,19 @@ class BaseSchema:
         Returns:
             str: A JSON string representation of the schema data.
         """
-        return json.dumps(self._data)
+        import json
+        return json.dumps(self.to_dict())
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Converts the schema data to a dictionary.
 
         Returns:
-            Dict[str, Any]: A dictionary representation of the schema data.
+            Dict[str, Any]: A copy of the schema data.
         """
-        return self._data
+        if self._defaults_pending:
+            self._materialize_defaults()
+        return self._current_data().copy()
 
 
 class DeclaredVars(DV):
@@ -151,6 +1065,160 @@ class DeclaredVars(DV):
 class DeclarativeVariablesMetaclass(DVM):
     declared_vars_class = DeclaredVars
 
+    def __new__(cls, name: str, bases: tuple, attrs: Dict[str, Any]) -> type:
+        use_slots = attrs.get('_use_slots', any(getattr(base, '_use_slots', False) for base in bases))
+        if use_slots and attrs.get('_incremental_validation',
+                                   any(getattr(base, '_incremental_validation', False) for base in bases)):
+            raise TypeError(f'{name} cannot use _incremental_validation, since slotted schemas do not track '
+                            'assignments.')
+        converted_fields = cls._add_slots(bases, attrs) if use_slots else ()
+        new_class = super().__new__(cls, name, bases, attrs)
+        for key in converted_fields:
+            setattr(new_class, key, cls._converting_slot(new_class, key))
+        # The validation plan is compiled on first use, so unused schemas do not build their validators
+        return new_class
+
+    @staticmethod
+    def _add_slots(bases: tuple, attrs: Dict[str, Any]) -> List[str]:
+        """
+        Adds a slot for every schema property and per-instance attribute that the bases do not have a slot for yet.
+
+        Properties whose Python value differs from the stored value get a private ``_v_{key}``
+        slot and are exposed through a converting descriptor; all others are stored under
+        their own name and read natively.
+
+        Args:
+            bases (tuple): A tuple of base classes.
+            attrs (Dict[str, Any]): A dictionary of attributes.
+
+        Returns:
+            List[str]: The keys of the properties that need a converting descriptor.
+        """
+        properties = {}
+        for base in reversed(bases):
+            properties.update(getattr(base, '_base_properties', {}))
+        properties.update((key, obj) for key, obj in attrs.items() if isinstance(obj, BaseProperty))
+
+        doc_attrs = tuple(attrs.get('BUILTIN_DOC_ATTRS', getattr(bases[0], 'BUILTIN_DOC_ATTRS', ())))
+        slots = list(attrs.get('__slots__', ()))
+        converted_fields = []
+        data_slots = []
+        for key, prop in properties.items():
+            if type(prop).get_python_value is not BaseProperty.get_python_value:
+                converted_fields.append(key)
+                key = f'_v_{key}'
+            data_slots.append(key)
+        slots.extend(data_slots)
+        slots.extend(doc_attrs)
+        slots.extend(attrs.get('_instance_slots', BaseSchema._instance_slots))
+        # Class attributes of the bases, such as BaseSchema._defaults, only provide fallbacks and get a slot
+        attrs['__slots__'] = tuple(dict.fromkeys(
+            slot for slot in slots
+            if not any(isinstance(getattr(base, slot, None), MemberDescriptorType) for base in bases)))
+        attrs['_data_keys'] = tuple(properties) + doc_attrs
+        attrs['_data_slots'] = tuple(data_slots) + doc_attrs
+        return converted_fields
+
+    @staticmethod
+    def _converting_slot(new_class: type, key: str) -> property:
+        """
+        Creates a descriptor that reads the private slot of a property natively and converts values on assignment.
+
+        Args:
+            new_class (type): The slotted schema class.
+            key (str): The property key.
+
+        Returns:
+            property: The descriptor for the property.
+        """
+        member = getattr(new_class, f'_v_{key}')
+        get_python_value = new_class._base_properties[key].get_python_value
+        set_value = member.__set__
+
+        def fset(instance: BaseSchema, value: Any) -> None:
+            try:
+                value = get_python_value(value)
+            except ValueError:
+                pass
+            set_value(instance, value)
+        return property(member.__get__, fset)
+
 
 class Schema(BaseSchema, metaclass=DeclarativeVariablesMetaclass):
+    __slots__ = ()
     BUILTIN_DOC_ATTRS = []
+
+
+class SlottedSchema(Schema):
+    """
+    Base class for schemas whose instances store their properties in slots instead of dictionaries.
+
+    Every property becomes a slot with a native descriptor, so reading and writing
+    properties does not go through __getattr__ or __setattr__, and instances have no
+    ``__dict__``. Values of properties that convert values, such as StringProperty,
+    are converted when they are assigned instead of when they are read. Other
+    attributes can only be set if they are declared in ``__slots__``.
+
+    ``_data`` is built from the slots on every access, so changes must be made
+    through the attributes rather than through ``_data``. Subclasses of a
+    non-slotted schema keep the ``__dict__`` of their base. Assignments are not
+    tracked, so defining a slotted schema with ``_incremental_validation`` raises
+    a TypeError.
+    """
+    __slots__ = ()
+    _use_slots = True
+    _data_keys: Tuple[str, ...] = ()
+    # The slot of every key in _data_keys, which is private for properties that convert values
+    _data_slots: Tuple[str, ...] = ()
+
+    __setattr__ = object.__setattr__
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for slots that have not been assigned yet
+        if name in self._data_keys:
+            if self._defaults_pending and name in self._get_defaults()[1]:
+                return self._materialize_default(name)
+            return None
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def _init_schema(self, kwargs: Dict[str, Any], partial: bool = False) -> None:
+        self._defaults_pending = not partial and not self._get_defaults()[1].issubset(kwargs)
+        self._data = self._build_data(kwargs, partial)
+
+    def _materialize_default(self, key: str) -> Any:
+        setattr(self, key, self._default_value(key))
+        return getattr(self, key)
+
+    def _materialize_defaults(self) -> None:
+        for key in self._get_defaults()[1]:
+            # Unassigned slots fall back to __getattr__, which fills in the default
+            getattr(self, key)
+        self._defaults_pending = False
+
+    def _init_trusted(self, data: Dict[str, Any]) -> None:
+        # Write the slots directly, bypassing the converting descriptors
+        for key, slot in zip(self._data_keys, self._data_slots):
+            if key in data:
+                object.__setattr__(self, slot, data[key])
+
+    @property
+    def _data(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self._data_keys}
+
+    def _current_data(self) -> Dict[str, Any]:
+        return self._data
+
+    @_data.setter
+    def _data(self, data: Dict[str, Any]) -> None:
+        for key in self._data_keys:
+            if key in data:
+                setattr(self, key, data[key])
+
+    def __getstate__(self) -> tuple:
+        return self._data, self._error_codes, self._is_valid, self.cleaned_data
+
+    def __setstate__(self, state: tuple) -> None:
+        self._data, self._error_codes, self._is_valid, self.cleaned_data = state
+        self._error_messages = None
+        self._defaults = None
+        self._defaults_pending = False
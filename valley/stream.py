@@ -0,0 +1,85 @@
+import json
+from typing import Any, BinaryIO, Dict, Iterator, NamedTuple, Optional, Type
+
+from valley.schema import BaseSchema, render_errors
+from valley.utils.json_utils import ValleyDecoder
+
+__all__ = ['StreamRecord', 'validate_ndjson']
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class StreamRecord(NamedTuple):
+    """
+    A validated record read from a newline-delimited JSON stream.
+
+    Attributes:
+        line (int): The 1-based line number of the record in the stream.
+        record (Any): The cleaned data of a plain record, or the schema instance of a typed record.
+        errors (Optional[Dict[str, str]]): The validation errors, or None if the record is valid.
+    """
+    line: int
+    record: Any
+    errors: Optional[Dict[str, str]]
+
+
+def validate_ndjson(fileobj: BinaryIO, schema_class: Type[BaseSchema],
+                    decoder_class: Type[json.JSONDecoder] = ValleyDecoder,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[StreamRecord]:
+    """
+    Lazily validates newline-delimited JSON read from a stream.
+
+    The stream is read in chunks of ``chunk_size``, so memory use only depends on the
+    chunk size and the longest line, not on the size of the stream. Plain objects are
+    validated against ``schema_class``. Objects that the decoder turns into schema
+    instances, such as ``ValleyDecoder`` records with a ``_type`` key, are validated
+    against their own class. Lines that are not JSON objects are yielded with a
+    ``_json`` error.
+
+    Args:
+        fileobj (BinaryIO): The stream to read from.
+        schema_class (Type[BaseSchema]): The schema class for plain records.
+        decoder_class (Type[json.JSONDecoder], optional): The JSON decoder class. Defaults to ValleyDecoder.
+        chunk_size (int, optional): The number of bytes to read at a time.
+
+    Yields:
+        StreamRecord: One record per non-blank line, in stream order.
+    """
+    decoder = decoder_class()
+    row_validators = {}
+
+    def validate_line(line_number: int, line: bytes) -> StreamRecord:
+        try:
+            obj = decoder.decode(line.decode('utf-8') if isinstance(line, bytes) else line)
+        except ValueError as e:
+            return StreamRecord(line_number, line, {'_json': str(e)})
+
+        if isinstance(obj, BaseSchema):
+            klass, row = type(obj), obj._data
+        elif isinstance(obj, dict):
+            klass, row = schema_class, obj
+        else:
+            return StreamRecord(line_number, obj, {'_json': 'Expected a JSON object.'})
+
+        validate_row = row_validators.get(klass)
+        if validate_row is None:
+            validate_row = row_validators[klass] = klass._make_row_validator()
+        data, error_codes = validate_row(row)
+        errors = None if error_codes is None else render_errors(error_codes)
+        return StreamRecord(line_number, data if obj is row else obj, errors)
+
+    line_number = 0
+    buffer = None
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+        lines = (buffer + chunk if buffer else chunk).split(b'\n' if isinstance(chunk, bytes) else '\n')
+        buffer = lines.pop()
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield validate_line(line_number, line)
+
+    if buffer and buffer.strip():
+        yield validate_line(line_number + 1, buffer)
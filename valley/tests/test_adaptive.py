@@ -0,0 +1,41 @@
+import unittest
+
+import valley
+from valley.adaptive import AdaptiveChain
+from valley.validators import MaxLengthValidator, SlugValidator, Validator
+
+
+class SlowValidator(Validator):
+    reorderable = True
+
+    def perform_validation(self, value, name):
+        sum(range(2000))
+
+
+class AdaptiveSlugs(valley.Schema):
+    _create_error_dict = True
+    _adaptive_validator_order = True
+    slug = valley.SlugProperty(required=True, max_length=5)
+
+
+class AdaptiveChainTests(unittest.TestCase):
+
+    def test_reorders_cheap_rejecting_validator_first(self):
+        chain = AdaptiveChain([SlowValidator(), MaxLengthValidator(3)], 'name', sample_every=1, reorder_every=8)
+        for _ in range(32):
+            self.assertEqual(chain('too long').code, 'max_length')
+        self.assertEqual(chain.order, [1, 0])
+        self.assertEqual([s['validator'] for s in chain.stats()], ['MaxLengthValidator', 'SlowValidator'])
+
+    def test_schema_pins_required_and_type_checks(self):
+        check = AdaptiveSlugs._get_validation_plan()[0][1]
+        chain = check.adaptive_chain
+        self.assertEqual([type(v) for v in chain.validators], [MaxLengthValidator, SlugValidator])
+        schema = AdaptiveSlugs(slug='a b')
+        schema.validate()
+        self.assertDictEqual(schema._errors, {
+            'slug': 'slug must be a valid slug (only letters, numbers, hyphens, and underscores).'})
+
+
+if __name__ == '__main__':
+    unittest.main()
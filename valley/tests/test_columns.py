@@ -0,0 +1,40 @@
+import array
+import unittest
+
+import valley
+from valley import columns
+from valley.columns import validate_column, validate_columns
+from valley.tests.examples.example_schemas import Student
+
+
+class ColumnTests(unittest.TestCase):
+
+    def setUp(self):
+        self.values = [4, 5, 18, 19, 10]
+
+    def test_list_column(self):
+        self.assertEqual(validate_column(Student._base_properties['age'], self.values), [0, 3])
+
+    def test_array_column(self):
+        self.assertEqual(validate_column(Student._base_properties['age'], array.array('q', self.values)), [0, 3])
+
+    def test_float_column_fails_integer_property(self):
+        self.assertEqual(validate_column(Student._base_properties['age'], array.array('d', [5.0, 6.0])), [0, 1])
+
+    def test_default_replaces_zero(self):
+        prop = valley.IntegerProperty(default_value=7, min_value=5)
+        self.assertEqual(validate_column(prop, array.array('q', [0, 3])), [1])
+
+    def test_validate_columns(self):
+        result = validate_columns(Student, {'age': array.array('q', self.values),
+                                            'gpa': array.array('d', [3.0, 4.0])})
+        self.assertDictEqual(result, {'age': [0, 3]})
+
+    @unittest.skipIf(columns.np is None, 'NumPy is not installed')
+    def test_numpy_column(self):
+        arr = columns.np.array(self.values * 3)
+        self.assertEqual(validate_column(Student._base_properties['age'], arr), [0, 3, 5, 8, 10, 13])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,3 @@
-import collections
 import unittest
 
 from valley.schema import BaseSchema
@@ -43,9 +42,9 @@ class DeclarativeTests(unittest.TestCase):
         self.assertIn('field2', instance._base_properties)
 
     def test_metaclass_prepare_namespace(self):
-        """Test if __prepare__ method of metaclass returns an OrderedDict."""
+        """Test if __prepare__ method of metaclass returns a plain dict."""
         namespace = DeclarativeVariablesMetaclass.__prepare__('Test', (object,))
-        self.assertIsInstance(namespace, collections.OrderedDict)
+        self.assertIs(type(namespace), dict)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,51 @@
+import unittest
+
+from valley import instrument
+from valley.schema import BaseSchema
+from valley.tests.examples.example_schemas import Student
+from valley.tests.test_schema import HookSchema
+
+NAME = 'valley.tests.examples.example_schemas.Student'
+
+
+class InstrumentTests(unittest.TestCase):
+
+    def setUp(self):
+        self.events = []
+        instrument.reset()
+        instrument.enable(lambda schema_class, nanoseconds, failed: self.events.append((schema_class, failed)))
+        self.addCleanup(instrument.disable)
+
+    def test_records_schema_field_and_validator_stats(self):
+        Student(name='Frank White', slug='frank-white', email='frank@white.com', age=18).validate()
+        Student(name='Ira', slug='frank-white', email='frank@white.com', age=18).validate()
+        stats = instrument.snapshot()[NAME]
+        self.assertEqual((2, 1), (stats['calls'], stats['failures']))
+        name = stats['fields']['name']
+        self.assertEqual((2, 1), (name['calls'], name['failures']))
+        self.assertEqual({'calls': 2, 'failures': 0}, {k: name['validators']['StringValidator'][k]
+                                                       for k in ('calls', 'failures')})
+        self.assertEqual(1, name['validators']['MinLengthValidator']['failures'])
+        self.assertGreater(stats['time_ns'], 0)
+        self.assertEqual([(Student, False), (Student, True)], self.events)
+
+    def test_hook_failures_are_recorded_for_the_field(self):
+        HookSchema(name='Admin').validate()
+        HookSchema(name='Frank').validate()
+        stats = instrument.snapshot()['valley.tests.test_schema.HookSchema']
+        self.assertEqual((2, 1), (stats['calls'], stats['failures']))
+        name = stats['fields']['name']
+        self.assertEqual((2, 1), (name['calls'], name['failures']))
+        self.assertEqual(0, name['validators']['StringValidator']['failures'])
+
+    def test_validate_many_rows(self):
+        Student.validate_many([{'name': 'Frank White', 'slug': 'frank', 'email': 'frank@white.com'}, {}])
+        stats = instrument.snapshot()[NAME]
+        self.assertEqual((2, 1), (stats['calls'], stats['failures']))
+
+    def test_disable_restores_plain_path(self):
+        instrument.disable()
+        self.assertEqual('validate', BaseSchema.validate.__name__)
+        self.assertNotIn('instrumented', Student._get_validation_plan()[0][1].__qualname__)
+        Student(name='Frank White', slug='frank-white', email='frank@white.com').validate()
+        self.assertEqual(0, instrument.snapshot().get(NAME, {'calls': 0})['calls'])
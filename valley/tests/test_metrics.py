@@ -0,0 +1,64 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from valley import instrument, metrics
+from valley.tests.examples.example_schemas import Student
+
+SCHEMA = 'schema="valley.tests.examples.example_schemas.Student"'
+
+
+class MetricsTests(unittest.TestCase):
+
+    def setUp(self):
+        instrument.reset()
+        metrics._histograms.clear()
+        metrics.enable()
+        self.addCleanup(instrument.disable)
+
+    def validate(self, **kwargs):
+        values = dict(name='Frank White', slug='frank-white', email='frank@white.com')
+        values.update(kwargs)
+        Student(**values).validate()
+
+    def test_render(self):
+        self.validate()
+        self.validate(name='Ira', email='frank')
+        text = metrics.render()
+        self.assertIn('# TYPE valley_validations_total counter', text)
+        self.assertIn(f'valley_validations_total{{{SCHEMA}}} 2\n', text)
+        self.assertIn(f'valley_validation_failures_total{{{SCHEMA}}} 1\n', text)
+        self.assertIn(f'valley_field_rejections_total{{{SCHEMA},field="name"}} 1\n', text)
+        self.assertIn(f'valley_validator_rejections_total{{{SCHEMA},validator="EmailValidator"}} 1\n', text)
+        self.assertIn(f'valley_validation_duration_seconds_bucket{{{SCHEMA},le="+Inf"}} 2\n', text)
+        self.assertIn(f'valley_validation_duration_seconds_count{{{SCHEMA}}} 2\n', text)
+
+    def test_threads_record_into_shards(self):
+        threads = [threading.Thread(target=lambda: [self.validate() for _ in range(50)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertIn(f'valley_validations_total{{{SCHEMA}}} 200\n', metrics.render())
+
+    def test_histogram_buckets(self):
+        histogram = metrics.Histogram((0.001, 0.01))
+        for nanoseconds in (500_000, 1_000_000, 5_000_000, 50_000_000):
+            histogram.observe(nanoseconds)
+        self.assertEqual(([2, 3], 4, 0.0565), histogram.totals())
+
+    def test_write(self):
+        self.validate()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'valley.prom')
+            metrics.write(path)
+            with open(path) as f:
+                self.assertIn(f'valley_validations_total{{{SCHEMA}}} 1\n', f.read())
+            self.assertEqual(['valley.prom'], os.listdir(directory))
+
+    def test_disable_keeps_instrument(self):
+        metrics.disable()
+        self.validate()
+        self.assertTrue(instrument.is_enabled())
+        self.assertNotIn('duration_seconds_count', metrics.render())
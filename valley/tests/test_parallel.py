@@ -0,0 +1,47 @@
+import pickle
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from valley.parallel import validate_parallel
+from valley.tests.examples.example_schemas import Breed, durham
+
+
+class ParallelTests(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = [{'name': 'Breed {}'.format(i)} if i % 3 else {'name': ''} for i in range(10)]
+
+    def test_matches_validate_many(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = validate_parallel(Breed, iter(self.rows), chunk_size=3, executor=executor)
+        self.assertEqual(result, Breed.validate_many(self.rows))
+        self.assertEqual(sorted(result.errors), [0, 3, 6, 9])
+
+    def test_max_pending(self):
+        futures, idle = [], []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                idle.append(all(future.done() for future in futures))
+                futures.append(super().submit(*args, **kwargs))
+                return futures[-1]
+
+        with RecordingExecutor(max_workers=2) as executor:
+            result = validate_parallel(Breed, iter(self.rows), chunk_size=3, executor=executor, max_pending=1)
+        self.assertEqual(result, Breed.validate_many(self.rows))
+        self.assertEqual([True] * 4, idle)
+
+    def test_process_pool(self):
+        result = validate_parallel(Breed, self.rows, chunk_size=4, max_workers=2)
+        self.assertEqual(result, Breed.validate_many(self.rows))
+
+    def test_pickle_instance(self):
+        troop = pickle.loads(pickle.dumps(durham))
+        self.assertEqual(troop.name, 'Durham')
+        self.assertEqual(troop.dogs[1].breed.name, 'Cockapoo')
+        troop.validate()
+        self.assertTrue(troop._is_valid)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,12 @@
+import asyncio
+import datetime
+import os
+import pickle
+import subprocess
+import sys
 import unittest
 
+import valley
 from valley.exceptions import ValidationException
 from valley.tests.examples.example_schemas import StudentB, Student, Troop, bruno, blitz, cocker
 
@@ -66,6 +73,13 @@ class SchemaTestCase(unittest.TestCase):
         ed = {'slug': 'slug must be a valid slug (only letters, numbers, hyphens, and underscores).'}
         self.assertDictEqual(ed, self.student._errors)
 
+    def test_error_messages_rendered_lazily(self):
+        self.student.name = None
+        self.student.validate()
+        self.assertIsNone(self.student._error_messages)
+        self.assertEqual(self.student._error_codes['name'].code, 'required')
+        self.assertDictEqual({'name': 'name is required and cannot be empty.'}, self.student._errors)
+
     def test_email_space(self):
         self.student.email = 'Some City'
         self.student.validate()
@@ -84,6 +98,12 @@ class SchemaTestCase(unittest.TestCase):
         ed = {'age': 'age must be an integer.'}
         self.assertDictEqual(ed, self.student._errors)
 
+    def test_falsy_boolean_uses_default(self):
+        for value in ('', 0):
+            self.student.active = value
+            self.student.validate()
+            self.assertDictEqual({}, self.student._errors)
+
     def test_age_numeric_float(self):
         self.student.age = 5.0
         self.student.validate()
@@ -112,10 +132,589 @@ class SchemaMethods(unittest.TestCase):
     def test_getattr(self):
         self.assertEqual(self.student.name, 'Frank White')
 
+    def test_python_value_cached_on_getattr(self):
+        self.student.name = 12345
+        self.assertNotIn('name', self.student.__dict__)
+        self.assertEqual(self.student.name, '12345')
+        self.assertEqual(self.student.__dict__['name'], '12345')
+        self.assertEqual(self.student._data['name'], 12345)
+
+    def test_cached_value_follows_data(self):
+        self.assertEqual(self.student.name, 'Frank White')
+        self.student._data['name'] = 'Changed'
+        self.assertEqual(self.student.name, 'Changed')
+        self.student._data = {'name': 1}
+        self.assertEqual(self.student.name, '1')
+        self.student.to_dict()['name'] = 'Copy'
+        self.assertEqual(self.student.name, '1')
+
     def test_error_dict_false_validate(self):
         self.studentb.name = 1
         self.assertRaises(ValidationException, self.studentb.validate)
 
+    def test_fail_fast(self):
+        self.studentb.name = 1
+        self.studentb.email = 'not an email'
+        self.assertEqual(('name', 'name must be a string.'), self.studentb.validate(fail_fast=True))
+        self.assertFalse(self.studentb._is_valid)
+        self.assertDictEqual({'name': 'name must be a string.'}, self.studentb._errors)
+
+    def test_fail_fast_valid(self):
+        self.assertIsNone(self.student.validate(fail_fast=True))
+        self.assertTrue(self.student._is_valid)
+
+
+class HookSchema(valley.Schema):
+    _create_error_dict = True
+    name = valley.StringProperty(required=True)
+    code = valley.StringProperty(default_value='abc', min_length=3)
+
+    def name_validate(self, value):
+        if value == 'Admin':
+            raise ValidationException('name cannot be Admin.')
+
+
+class ReservedNameException(ValidationException):
+    pass
+
+
+class ReservedValidator(valley.validators.Validator):
+    def perform_validation(self, value, name):
+        if value == 'root':
+            raise ReservedNameException(f'{name} is reserved.')
+
+
+class StrictHookSchema(valley.Schema):
+    _create_error_dict = False
+    name = valley.StringProperty(validators=[ReservedValidator()])
+
+    def name_validate(self, value):
+        if value == 'Admin':
+            raise ReservedNameException('name cannot be Admin.')
+
+
+class LoggingHookSchema(HookSchema):
+    logged = None
+
+    def _handle_validation_error(self, key, error):
+        self.logged.append((key, error.error_msg))
+        super()._handle_validation_error(key, error)
+
+
+class ErrorHandlingTests(unittest.TestCase):
+
+    def test_exception_subclass_raised_as_is(self):
+        for name in ('Admin', 'root'):
+            with self.assertRaises(ReservedNameException):
+                StrictHookSchema(name=name).validate()
+
+    def test_handler_override_gets_exception(self):
+        schema = LoggingHookSchema(name='Admin', code='ab')
+        schema.logged = []
+        schema.validate()
+        self.assertEqual([('name', 'name cannot be Admin.'),
+                          ('code', 'code must not be shorter than 3 characters.')], schema.logged)
+        self.assertDictEqual({'name': 'name cannot be Admin.',
+                              'code': 'code must not be shorter than 3 characters.'}, schema._errors)
+
+
+class ValidationPlanTests(unittest.TestCase):
+
+    def test_plan_compiled_on_first_use(self):
+        class Pet(valley.Schema):
+            name = valley.StringProperty(max_length=10)
+        self.assertNotIn('_validation_plan', Pet.__dict__)
+        self.assertFalse(Pet._base_properties['name']._validators_built)
+        Pet(name='Rex').validate()
+        self.assertIn('_validation_plan', Pet.__dict__)
+        plan = HookSchema._get_validation_plan()
+        self.assertEqual([key for key, _, _ in plan], ['name', 'code'])
+        self.assertIsNotNone(plan[0][2])
+        self.assertIsNone(plan[1][2])
+
+    def test_import_loads_no_optional_modules(self):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        output = subprocess.run(
+            [sys.executable, '-c', 'import sys, valley\n'
+                                   'print(sorted(set(sys.modules) & {"inspect", "json", "threading", "weakref", '
+                                   '"valley.instrument"}))'],
+            cwd=root, capture_output=True, text=True, check=True).stdout
+        self.assertEqual('[]', output.strip())
+
+    def test_hook(self):
+        schema = HookSchema(name='Admin')
+        schema.validate()
+        self.assertDictEqual({'name': 'name cannot be Admin.'}, schema._errors)
+
+    def test_default_used_for_empty_value(self):
+        schema = HookSchema(name='Frank', code='')
+        schema.validate()
+        self.assertTrue(schema._is_valid)
+
+    def test_instance_hook(self):
+        def name_validate(value):
+            raise ValidationException('not this one.')
+        schema = HookSchema(name='Frank')
+        schema.name_validate = name_validate
+        schema.validate()
+        self.assertDictEqual({'name': 'not this one.'}, schema._errors)
+        self.assertIsNone(HookSchema(name='Frank').validate(fail_fast=True))
+        self.assertEqual(('name', 'not this one.'), schema.validate(fail_fast=True))
+
+    def test_recompile_picks_up_new_hook(self):
+        class Pet(valley.Schema):
+            _create_error_dict = True
+            name = valley.StringProperty()
+
+        def name_validate(self, value):
+            raise ValidationException('no pets allowed.')
+        Pet.name_validate = name_validate
+        Pet._compile_validation_plan()
+        pet = Pet(name='Rex')
+        pet.validate()
+        self.assertDictEqual({'name': 'no pets allowed.'}, pet._errors)
+
+
+class ValidateManyTests(unittest.TestCase):
+
+    def test_validate_many(self):
+        rows = iter([
+            {'name': 'Frank'},
+            {'name': 'Admin'},
+            {'code': 'xyz'},
+            {'name': 'Curious George', 'code': 'ab'},
+        ])
+        result = HookSchema.validate_many(rows)
+        self.assertEqual(result.valid, [{'name': 'Frank', 'code': 'abc'}])
+        self.assertDictEqual(result.errors, {
+            1: {'name': 'name cannot be Admin.'},
+            2: {'name': 'name is required and cannot be empty.'},
+            3: {'code': 'code must not be shorter than 3 characters.'},
+        })
+
+    def test_validate_many_collects_errors_without_error_dict(self):
+        result = StudentB.validate_many([{'name': 1}])
+        self.assertIn('name', result.errors[0])
+
+
+class UniqueEmailValidator(valley.validators.Validator):
+    async def perform_validation(self, value, name):
+        await asyncio.sleep(0)
+        if value == 'taken@example.com':
+            raise ValidationException(f'{name} is already taken.')
+
+
+class AsyncSchema(valley.Schema):
+    _create_error_dict = True
+    email = valley.EmailProperty(required=True, validators=[UniqueEmailValidator()])
+    name = valley.StringProperty(required=True)
+    code = valley.StringProperty()
+
+    async def name_validate(self, value):
+        await asyncio.sleep(0)
+        if value == 'Admin':
+            raise ValidationException('name cannot be Admin.')
+
+
+class AsyncValidationTests(unittest.TestCase):
+
+    def test_avalidate(self):
+        schema = AsyncSchema(email='taken@example.com', name='Admin')
+        schema.code = 1
+        asyncio.run(schema.avalidate(concurrency=1))
+        self.assertFalse(schema._is_valid)
+        self.assertDictEqual({'email': 'email is already taken.',
+                              'name': 'name cannot be Admin.',
+                              'code': 'code must be a string.'}, schema._errors)
+
+    def test_avalidate_valid(self):
+        schema = AsyncSchema(email='frank@white.com', name='Frank')
+        asyncio.run(schema.avalidate())
+        self.assertTrue(schema._is_valid)
+
+    def test_sync_validation_rejected(self):
+        schema = AsyncSchema(email='taken@example.com', name='Admin')
+        with self.assertRaisesRegex(TypeError, 'avalidate'):
+            schema.validate()
+        with self.assertRaises(TypeError):
+            schema.validate(fail_fast=True)
+        with self.assertRaises(TypeError):
+            AsyncSchema.validate_many([{'email': 'taken@example.com', 'name': 'Admin'}])
+
+    def test_avalidate_sync_schema(self):
+        self.assertIsNone(HookSchema._get_async_plan())
+        schema = HookSchema(name='Admin')
+        asyncio.run(schema.avalidate())
+        self.assertDictEqual({'name': 'name cannot be Admin.'}, schema._errors)
+
+
+class SlottedStudent(valley.SlottedSchema):
+    _create_error_dict = True
+    name = valley.StringProperty(required=True, min_length=5)
+    age = valley.IntegerProperty(min_value=5)
+
+    def name_validate(self, value):
+        if value == 'Admin':
+            raise ValidationException('name cannot be Admin.')
+
+
+class SlottedGraduate(SlottedStudent):
+    year = valley.IntegerProperty(required=True)
+
+
+class SlottedSchemaTests(unittest.TestCase):
+
+    def setUp(self):
+        self.student = SlottedGraduate(name='Frank White', age=18, year=2017)
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(self.student, '__dict__'))
+        self.assertEqual(SlottedGraduate.__slots__, ('year',))
+
+    def test_attributes(self):
+        self.assertEqual(self.student.name, 'Frank White')
+        self.student.name = 12345
+        self.assertEqual(self.student.name, '12345')
+        self.assertDictEqual(self.student.to_dict(), {'name': '12345', 'age': 18, 'year': 2017})
+
+    def test_validate(self):
+        self.student.name = 'Admin'
+        self.student.year = None
+        self.student.validate()
+        self.assertDictEqual({'name': 'name cannot be Admin.',
+                              'year': 'year is required and cannot be empty.'}, self.student._errors)
+
+    def test_validate_many(self):
+        result = SlottedGraduate.validate_many([{'name': 'Frank White', 'year': 2017}, {'name': 'Ira'}])
+        self.assertEqual(len(result.valid), 1)
+        self.assertEqual(list(result.errors), [1])
+
+    def test_pickle(self):
+        student = pickle.loads(pickle.dumps(self.student))
+        self.assertDictEqual(student.to_dict(), self.student.to_dict())
+
+    def test_incremental_validation_rejected(self):
+        with self.assertRaises(TypeError):
+            class SlottedDocument(SlottedStudent):
+                _incremental_validation = True
+
+
+class Document(valley.Schema):
+    _create_error_dict = True
+    _incremental_validation = True
+    title = valley.StringProperty(required=True)
+    body = valley.StringProperty(max_length=10)
+    summary = valley.StringProperty()
+
+    calls = None
+
+    @valley.depends_on('body')
+    def summary_validate(self, value):
+        self.calls.append('summary')
+        if value and self.body and len(value) > len(self.body):
+            raise ValidationException('summary must be shorter than body.')
+
+    def title_validate(self, value):
+        self.calls.append('title')
+
+
+class IncrementalValidationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.doc = Document(title='Notes', body='0123456789', summary='short')
+        self.doc.calls = []
+        self.doc.validate()
+
+    def test_first_validation_is_full(self):
+        self.assertEqual(self.doc.calls, ['title', 'summary'])
+        self.assertTrue(self.doc._is_valid)
+
+    def test_only_dirty_fields_revalidated(self):
+        self.doc.calls = []
+        self.doc.title = None
+        self.doc.validate()
+        self.assertEqual(self.doc.calls, [])
+        self.assertDictEqual(self.doc._errors, {'title': 'title is required and cannot be empty.'})
+        self.doc.validate()
+        self.assertDictEqual(self.doc._errors, {'title': 'title is required and cannot be empty.'})
+
+    def test_dependent_hook_revalidated(self):
+        self.doc.calls = []
+        self.doc.body = 'abc'
+        self.doc.validate()
+        self.assertEqual(self.doc.calls, ['summary'])
+        self.assertDictEqual(self.doc._errors, {'summary': 'summary must be shorter than body.'})
+
+    def test_full(self):
+        self.doc.calls = []
+        self.doc.validate(full=True)
+        self.assertEqual(self.doc.calls, ['title', 'summary'])
+
+
+class QueryParams(valley.Schema):
+    _create_error_dict = True
+    _coerce_values = True
+    page = valley.IntegerProperty(min_value=1, max_value=100)
+    ratio = valley.FloatProperty()
+    since = valley.DateProperty()
+    until = valley.DateTimeProperty()
+    q = valley.StringProperty(max_length=10)
+
+
+class CoerceValuesTests(unittest.TestCase):
+
+    def test_cleaned_data_is_typed(self):
+        params = QueryParams(page='42', ratio='0.5', since='2017-01-10', until='2017-01-10T12:00:00', q='frog')
+        params.validate()
+        self.assertTrue(params._is_valid)
+        self.assertEqual({'page': 42, 'ratio': 0.5, 'since': datetime.date(2017, 1, 10),
+                          'until': datetime.datetime(2017, 1, 10, 12), 'q': 'frog'}, params.cleaned_data)
+        self.assertEqual('42', params._data['page'])
+
+    def test_constraints_check_parsed_value(self):
+        params = QueryParams(page='420')
+        params.validate()
+        self.assertDictEqual({'page': 'page must not be greater than 100.'}, params._errors)
+        params.page = 'x'
+        params.validate()
+        self.assertDictEqual({'page': 'page must be an integer.'}, params._errors)
+
+    def test_validate_many(self):
+        result = QueryParams.validate_many([{'page': '2', 'since': '2017-W02-2'}, {'page': '0'}])
+        self.assertEqual([{'page': 2, 'ratio': None, 'since': datetime.date(2017, 1, 10), 'until': None, 'q': None}],
+                         result.valid)
+        self.assertEqual(['min_value'], [error.code for error in result.error_codes[1].values()])
+
+    def test_fail_fast(self):
+        params = QueryParams(page='3', ratio='x')
+        self.assertEqual(('ratio', 'ratio must be a float.'), params.validate(fail_fast=True))
+        self.assertEqual(3, params.cleaned_data['page'])
+
+
+class Customer(valley.Schema):
+    _create_error_dict = True
+    email = valley.EmailProperty(required=True, cache_size=2)
+    visits = valley.IntegerProperty(min_value=0, cache_size=2)
+
+
+class CachedStrictSchema(valley.Schema):
+    _create_error_dict = False
+    name = valley.StringProperty(validators=[ReservedValidator()], cache_size=4)
+
+
+class ResultCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        for prop in Customer._base_properties.values():
+            prop.cache_clear()
+
+    def test_repeated_values_hit_the_cache(self):
+        result = Customer.validate_many([{'email': 'frog@example.com', 'visits': 1}] * 3
+                                        + [{'email': 'frog', 'visits': True}])
+        self.assertEqual(3, len(result.valid))
+        self.assertEqual(['email'], list(result.error_codes[3]))
+        info = Customer._base_properties['email'].cache_info()
+        self.assertEqual((2, 2), (info.hits, info.misses))
+        # Values of different types are cached separately
+        info = Customer._base_properties['visits'].cache_info()
+        self.assertEqual((2, 2), (info.hits, info.misses))
+
+    def test_cache_shared_with_subclasses(self):
+        class VipCustomer(Customer):
+            pass
+        Customer.validate_many([{'email': 'frog@example.com', 'visits': 1}] * 3)
+        VipCustomer(email='frog@example.com', visits=1).validate()
+        Customer._compile_validation_plan()
+        info = Customer._base_properties['email'].cache_info()
+        self.assertEqual((3, 1, 1), (info.hits, info.misses, info.currsize))
+
+    def test_raised_errors_are_not_cached(self):
+        raised = []
+        for _ in range(3):
+            with self.assertRaises(ReservedNameException) as cm:
+                CachedStrictSchema(name='root').validate()
+            raised.append(cm.exception)
+        self.assertIsNot(raised[0], raised[2])
+        info = CachedStrictSchema._base_properties['name'].cache_info()
+        self.assertEqual((0, 3, 0), (info.hits, info.misses, info.currsize))
+
+    def test_mutable_values_are_not_cached(self):
+        Customer.validate_many([{'email': ['frog@example.com']}] * 2)
+        self.assertEqual(0, Customer._base_properties['email'].cache_info().currsize)
+
+    def test_no_cache_by_default(self):
+        self.assertIsNone(Student._base_properties['email'].cache_info())
+
+
+class Profile(valley.Schema):
+    _create_error_dict = True
+    username = valley.SlugProperty(required=True)
+    password = valley.StringProperty(min_length=8)
+    confirm = valley.StringProperty()
+    age = valley.IntegerProperty(default_value=lambda: 18)
+
+    @valley.depends_on('password')
+    def confirm_validate(self, value):
+        if self.password != value:
+            raise ValidationException('confirm must match password.')
+
+
+class PartialValidationTests(unittest.TestCase):
+
+    def test_validate_partial(self):
+        profile = Profile.validate_partial({'password': 'long enough', 'confirm': 'long enough'})
+        self.assertTrue(profile._is_valid)
+        self.assertEqual({'password': 'long enough', 'confirm': 'long enough'}, profile.cleaned_data)
+        self.assertEqual({'password': 'long enough', 'confirm': 'long enough'}, profile._data)
+        self.assertIsNone(profile.username)
+        self.assertIsNone(profile.age)
+
+    def test_dependent_hooks_run(self):
+        profile = Profile.validate_partial({'password': 'long enough'})
+        self.assertDictEqual({'confirm': 'confirm must match password.'}, profile._errors)
+        self.assertEqual({'password': 'long enough'}, profile.cleaned_data)
+
+    def test_required_fields(self):
+        self.assertTrue(Profile.validate_partial({'age': 3})._is_valid)
+        profile = Profile.validate_partial({'age': 3}, required=True)
+        self.assertDictEqual({'username': 'username is required and cannot be empty.'}, profile._errors)
+
+    def test_validate_fields(self):
+        profile = Profile(username='not a slug', password='short')
+        profile.validate(fields=['password'])
+        self.assertDictEqual({'password': 'password must not be shorter than 8 characters.',
+                              'confirm': 'confirm must match password.'}, profile._errors)
+        self.assertEqual(('username', 'username must be a valid slug (only letters, numbers, hyphens, and underscores).'),
+                         profile.validate(fields=['username', 'age'], fail_fast=True))
+
+    def test_partial_slotted(self):
+        student = SlottedStudent.validate_partial({'email': 'frank@white.com'})
+        self.assertTrue(student._is_valid)
+        self.assertIsNone(student.name)
+
+
+class TrustedDataTests(unittest.TestCase):
+
+    def test_adopts_data(self):
+        data = {'username': 'frank', 'password': 'long enough'}
+        profile = Profile.from_trusted(data)
+        self.assertIs(data, profile._data)
+        self.assertEqual('frank', profile.username)
+        self.assertEqual('long enough', profile.password)
+        profile.username = 'ira'
+        self.assertEqual('ira', data['username'])
+
+    def test_defaults_not_evaluated(self):
+        profile = Profile.from_trusted({'username': 'frank'})
+        self.assertNotIn('age', profile._data)
+        self.assertIsNone(profile.age)
+
+    def test_validate(self):
+        profile = Profile.from_trusted({'username': 'frank', 'password': 'short'})
+        self.assertFalse(profile._is_valid)
+        profile.validate()
+        self.assertDictEqual({'password': 'password must not be shorter than 8 characters.',
+                              'confirm': 'confirm must match password.'}, profile._errors)
+
+    def test_slotted(self):
+        student = SlottedGraduate.from_trusted({'name': 'Frank White', 'year': 2017})
+        self.assertEqual('Frank White', student.name)
+        self.assertEqual(2017, student.year)
+        self.assertIsNone(student.age)
+        student.validate()
+        self.assertTrue(student._is_valid)
+
+
+class Ticket(valley.Schema):
+    _create_error_dict = True
+    number = valley.IntegerProperty(default_value=lambda: Ticket.issue())
+    title = valley.StringProperty(default_value='untitled')
+    urgent = valley.BooleanProperty()
+    issued = 0
+
+    @classmethod
+    def issue(cls):
+        cls.issued += 1
+        return cls.issued
+
+
+class Record(valley.Schema):
+    BUILTIN_DOC_ATTRS = ['id']
+    name = valley.StringProperty()
+    number = valley.IntegerProperty(default_value=lambda: Ticket.issue())
+
+
+class SlottedTicket(valley.SlottedSchema):
+    number = valley.IntegerProperty(default_value=lambda: Ticket.issue())
+
+
+class LazyDefaultTests(unittest.TestCase):
+
+    def setUp(self):
+        Ticket.issued = 0
+
+    def test_static_defaults_precomputed(self):
+        static, dynamic = Ticket._get_defaults()
+        self.assertEqual({'title': 'untitled', 'urgent': False}, static)
+        self.assertEqual(frozenset(['number']), dynamic)
+
+    def test_factory_not_called_until_needed(self):
+        ticket = Ticket(title='Broken')
+        self.assertEqual(0, Ticket.issued)
+        self.assertNotIn('number', ticket._data)
+        Ticket(number=7).validate()
+        self.assertEqual(0, Ticket.issued)
+
+    def test_factory_called_once_per_instance(self):
+        ticket = Ticket()
+        self.assertEqual(1, ticket.number)
+        self.assertEqual(1, ticket.number)
+        ticket.validate()
+        self.assertEqual({'number': 1, 'title': 'untitled', 'urgent': False}, ticket.to_dict())
+        self.assertEqual(1, Ticket.issued)
+        self.assertEqual(2, Ticket().to_dict()['number'])
+
+    def test_validate_fields_skips_other_defaults(self):
+        ticket = Ticket(title='Broken')
+        ticket.validate(fields=['title'])
+        self.assertTrue(ticket._is_valid)
+        self.assertEqual(0, Ticket.issued)
+        ticket.validate(fields=['number'])
+        self.assertEqual({'number': 1}, ticket.cleaned_data)
+        self.assertEqual(1, Ticket.issued)
+
+    def test_substituted_default_reused(self):
+        ticket = Ticket(number=0)
+        ticket.validate()
+        ticket.validate(fail_fast=True)
+        self.assertTrue(ticket._is_valid)
+        self.assertEqual(1, Ticket.issued)
+        self.assertEqual(0, ticket.number)
+
+    def test_validate_many(self):
+        batch = Ticket.validate_many([{}, {'title': 'Broken'}, {'number': 9}])
+        self.assertEqual([1, 2, 9], [row['number'] for row in batch.valid])
+        self.assertEqual(2, Ticket.issued)
+
+    def test_pickle(self):
+        ticket = pickle.loads(pickle.dumps(Ticket()))
+        self.assertEqual(1, ticket.number)
+        self.assertEqual(1, Ticket.issued)
+
+    def test_doc_attrs_not_exposed_as_attributes(self):
+        record = Record(name='Frank', id='doc1')
+        self.assertEqual('doc1', record._data['id'])
+        self.assertFalse(hasattr(record, 'id'))
+        self.assertEqual(0, Ticket.issued)
+
+    def test_slotted(self):
+        ticket = SlottedTicket()
+        self.assertEqual(0, Ticket.issued)
+        self.assertEqual(1, ticket.number)
+        ticket.validate()
+        self.assertEqual({'number': 1}, ticket.to_dict())
+        self.assertEqual(1, Ticket.issued)
+
 
 if __name__ == '__main__':
     unittest.main()
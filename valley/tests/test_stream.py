@@ -0,0 +1,35 @@
+import io
+import unittest
+
+from valley.stream import validate_ndjson
+from valley.tests.examples.example_schemas import Breed, Dog
+
+
+class StreamTests(unittest.TestCase):
+    ndjson = (b'{"name": "Cocker Spaniel"}\n'
+              b'\n'
+              b'{"name": null}\n'
+              b'not json\n'
+              b'{"name": "Bruno", "breed": {"name": "Cockapoo", '
+              b'"_type": "valley.tests.examples.example_schemas.Breed"}, '
+              b'"_type": "valley.tests.examples.example_schemas.Dog"}')
+
+    def test_validate_ndjson(self):
+        records = list(validate_ndjson(io.BytesIO(self.ndjson), Breed, chunk_size=7))
+        self.assertEqual([r.line for r in records], [1, 3, 4, 5])
+        self.assertEqual(records[0].record, {'name': 'Cocker Spaniel'})
+        self.assertIsNone(records[0].errors)
+        self.assertDictEqual(records[1].errors, {'name': 'name is required and cannot be empty.'})
+        self.assertIn('_json', records[2].errors)
+        self.assertIsInstance(records[3].record, Dog)
+        self.assertIsNone(records[3].errors)
+
+    def test_is_lazy(self):
+        stream = io.BytesIO(self.ndjson)
+        records = validate_ndjson(stream, Breed, chunk_size=30)
+        next(records)
+        self.assertLess(stream.tell(), len(self.ndjson))
+
+
+if __name__ == '__main__':
+    unittest.main()
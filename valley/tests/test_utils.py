@@ -1,8 +1,10 @@
+import datetime
 import json
 import unittest
 
 from valley.tests.examples.example_schemas import durham
 from valley.utils import import_util
+from valley.utils.dates import parse_date, parse_datetime
 from valley.utils.json_utils import (ValleyEncoder, ValleyDecoder)
 
 
@@ -32,3 +34,29 @@ class UtilTest(unittest.TestCase):
         self.assertEqual(new_troop.primary_breed.name, durham.primary_breed.name)
         self.assertEqual(new_troop.dogs[0].name, durham.dogs[0].name)
         self.assertEqual(new_troop.dogs[1].name, durham.dogs[1].name)
+
+
+class DatesTest(unittest.TestCase):
+
+    def test_parse_date(self):
+        expected = datetime.date(2017, 1, 10)
+        for value in ('2017-01-10', '20170110', '2017-W02-2', '2017-010'):
+            self.assertEqual(parse_date(value), expected, value)
+        for value in ('2017-13-01', '2017-366', 'not a date'):
+            self.assertIsNone(parse_date(value), value)
+
+    def test_parse_datetime(self):
+        utc = datetime.timezone.utc
+        self.assertEqual(parse_datetime('2017-01-10T12:00:00'), datetime.datetime(2017, 1, 10, 12))
+        self.assertEqual(parse_datetime('20170110T120000Z'), datetime.datetime(2017, 1, 10, 12, tzinfo=utc))
+        self.assertEqual(parse_datetime('2017-01-10 12:00:00.1234567-05:00'),
+                         datetime.datetime(2017, 1, 10, 17, 0, 0, 123456, tzinfo=utc))
+        self.assertEqual(parse_datetime('2017-1-5T1:2:3'), datetime.datetime(2017, 1, 5, 1, 2, 3))
+        for value in ('2017-01-10', '2017-01-10T25:00', '2017-01-10T12:00:00garbage'):
+            self.assertIsNone(parse_datetime(value), value)
+
+    def test_parse_cache(self):
+        parse_datetime.cache_clear()
+        parse_datetime('2017-01-10T12:00:00')
+        parse_datetime('2017-01-10T12:00:00')
+        self.assertEqual(parse_datetime.cache_info().hits, 1)
@@ -1,4 +1,6 @@
 import datetime
+import os
+import tempfile
 import unittest
 
 from valley.validators import (RequiredValidator, DateTimeValidator,
@@ -7,8 +9,22 @@ from valley.validators import (RequiredValidator, DateTimeValidator,
                                MaxValueValidator, MinValueValidator,
                                StringValidator, ValidationException,
                                BooleanValidator, DictValidator,
-                               ListValidator
+                               ListValidator, ChoiceValidator, EmailValidator, LazyPattern,
+                               Validator, as_check, as_coerce
                                )
+from valley.exceptions import ErrorCode
+
+
+class LegacyValidator(Validator):
+    def perform_validation(self, value, name):
+        if value == 'legacy':
+            raise ValidationException(f'{name} cannot be legacy.')
+
+
+class CustomMaxLengthValidator(MaxLengthValidator):
+    def perform_validation(self, value, name):
+        if value == 'custom':
+            raise ValidationException(f'{name} cannot be custom.')
 
 
 class ValidatorsTestCase(unittest.TestCase):
@@ -119,5 +135,106 @@ class ValidatorsTestCase(unittest.TestCase):
         ListValidator().validate(['Ridge Valley High', 'Lewis Cone Elementary'], 'schools')
 
 
+
+class CheckProtocolTestCase(unittest.TestCase):
+
+    def test_check_returns_error_code(self):
+        error = MaxLengthValidator(2).check('123')
+        self.assertEqual(error.code, 'max_length')
+        self.assertEqual(error.message('no_packages'), 'no_packages must not be longer than 2 characters.')
+        self.assertIsNone(MaxLengthValidator(2).check('12'))
+
+    def test_as_check_uses_native_check(self):
+        validator = StringValidator()
+        self.assertEqual(as_check(validator, 'name'), validator.check)
+
+    def test_as_check_adapts_perform_validation(self):
+        for validator in (LegacyValidator(), CustomMaxLengthValidator(2)):
+            check = as_check(validator, 'name')
+            self.assertIsNone(check('ok'))
+        error = as_check(LegacyValidator(), 'name')('legacy')
+        self.assertEqual(error, ErrorCode.from_message('name cannot be legacy.'))
+        self.assertEqual(as_check(CustomMaxLengthValidator(2), 'name')('custom').message('name'),
+                         'name cannot be custom.')
+
+    def test_coerce_returns_parsed_value(self):
+        self.assertEqual((42, None), IntegerValidator().coerce('42'))
+        self.assertEqual((datetime.date(2017, 1, 10), None), DateValidator().coerce('2017-01-10'))
+        value, error = FloatValidator().coerce('x')
+        self.assertEqual(('x', 'float'), (value, error.code))
+
+    def test_as_coerce_skips_validators_that_do_not_parse(self):
+        validator = IntegerValidator()
+        self.assertEqual(as_coerce(validator), validator.coerce)
+        self.assertIsNone(as_coerce(StringValidator()))
+        self.assertIsNone(as_coerce(CustomMaxLengthValidator(2)))
+
+
+class ChoiceValidatorTestCase(unittest.TestCase):
+
+    def test_dict_choices(self):
+        validator = ChoiceValidator({'Red': 'red', 'Blue': 'blue'})
+        self.assertIsNone(validator.check('red'))
+        self.assertEqual(validator.check('Red').message('color'), "color must be one of 'red', 'blue'.")
+
+    def test_unhashable_values_and_choices(self):
+        validator = ChoiceValidator([1, [2, 3]])
+        self.assertIsNone(validator.check(1))
+        self.assertIsNone(validator.check([2, 3]))
+        self.assertIsNotNone(validator.check({'a': 1}))
+
+    def test_message_is_truncated(self):
+        validator = ChoiceValidator(range(1000))
+        self.assertIsNone(validator.check(999))
+        self.assertEqual(validator.check(1000).message('n'), 'n must be one of 0, 1, 2, 3, 4, 5, 6, 7, 8, 9 and 990 more.')
+
+    def test_lazy_choices(self):
+        calls = []
+
+        def load():
+            calls.append(1)
+            return ['USD', 'EUR']
+        validator = ChoiceValidator(load)
+        self.assertEqual([], calls)
+        self.assertIsNone(validator.check('EUR'))
+        self.assertIsNotNone(validator.check('GBP'))
+        self.assertEqual([1], calls)
+
+    def test_choices_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'currencies.txt')
+            with open(path, 'w') as f:
+                f.write('USD\nEUR\n')
+            validator = ChoiceValidator(path)
+            self.assertIsNone(validator.check('USD'))
+            self.assertIsNotNone(validator.check('GBP'))
+
+
+class SharedValidatorTestCase(unittest.TestCase):
+
+    def test_shared_per_class_and_parameters(self):
+        self.assertIs(MaxValueValidator.shared(5), MaxValueValidator.shared(5))
+        self.assertIsNot(MaxValueValidator.shared(5), MinValueValidator.shared(5))
+        self.assertIsNot(MaxValueValidator.shared(1), MaxValueValidator.shared(True))
+        self.assertIsNot(ChoiceValidator.shared({'a': 1}), ChoiceValidator.shared({'a': 1}))
+
+    def test_properties_share_validators(self):
+        from valley.properties import StringProperty
+        first, second = StringProperty(max_length=10), StringProperty(max_length=10)
+        self.assertEqual([id(v) for v in first.validators], [id(v) for v in second.validators])
+
+    def test_pattern_compiled_on_first_use(self):
+        class Code(Validator):
+            pattern = LazyPattern(r'^[A-Z]{3}$')
+
+        class SubCode(Code):
+            pass
+        self.assertIsInstance(Code.__dict__['pattern'], LazyPattern)
+        compiled = SubCode().pattern
+        self.assertIs(Code.__dict__['pattern'], compiled)
+        self.assertIs(Code().pattern, compiled)
+        self.assertIsNone(EmailValidator.shared().check('frog@example.com'))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,123 @@
+import datetime
+import functools
+import time
+from typing import Optional, Pattern
+
+__all__ = ['parse_date', 'parse_datetime', 'CACHE_SIZE']
+
+# The number of distinct strings each parser remembers.
+CACHE_SIZE = 4096
+
+_DATE_PATTERN = (
+    r'(?P<year>\d{4})(?:'
+    r'-?(?P<month>\d{2})-?(?P<day>\d{2})'  # calendar date
+    r'|-?W(?P<week>\d{2})-?(?P<weekday>[1-7])'  # week date
+    r'|-?(?P<ordinal>\d{3})'  # ordinal date
+    r')$'
+)
+
+_TIME_PATTERN = (
+    r'(?P<hour>\d{2})(?::?(?P<minute>\d{2})(?::?(?P<second>\d{2})(?:[.,](?P<fraction>\d+))?)?)?'
+    r'(?P<offset>[Zz]|[+-]\d{2}(?::?\d{2})?)?$'
+)
+
+
+# The patterns are only needed for the forms fromisoformat() rejects, so they and the re module are
+# only loaded on first use
+@functools.lru_cache(maxsize=None)
+def _compiled(pattern: str) -> Pattern:
+    import re
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def parse_date(value: str) -> Optional[datetime.date]:
+    """
+    Parses an ISO-8601 date, i.e. a calendar, week or ordinal date in basic or extended format.
+
+    The common ``YYYY-MM-DD`` form goes through ``date.fromisoformat``. Results are kept
+    in an LRU cache, so repeated dates are only parsed once.
+
+    Args:
+        value (str): The string to parse.
+
+    Returns:
+        Optional[datetime.date]: The date, or None if the string is not a valid date.
+    """
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        pass
+    match = _compiled(_DATE_PATTERN).match(value)
+    try:
+        if match is not None:
+            return _date_from_match(match)
+        # Non-padded dates such as 2017-1-5 have always been accepted
+        return datetime.date(*time.strptime(value, '%Y-%m-%d')[:3])
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def parse_datetime(value: str) -> Optional[datetime.datetime]:
+    """
+    Parses an ISO-8601 date and time, including fractional seconds and UTC offsets.
+
+    The date and time may be separated by ``T`` or a space. Strings with an offset
+    return aware datetimes, all others naive ones. Results are kept in an LRU cache,
+    so repeated timestamps are only parsed once.
+
+    Args:
+        value (str): The string to parse.
+
+    Returns:
+        Optional[datetime.datetime]: The datetime, or None if the string is not a valid date and time.
+    """
+    date_part, separator, time_part = value.partition('T') if 'T' in value else value.partition(' ')
+    if not separator or not time_part:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+
+    date = parse_date(date_part)
+    if date is None:
+        return None
+    match = _compiled(_TIME_PATTERN).match(time_part)
+    try:
+        if match is None:
+            # Non-padded datetimes such as 2017-1-5T1:2:3 have always been accepted
+            return datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S')
+        fraction = match.group('fraction') or ''
+        return datetime.datetime.combine(date, datetime.time(
+            int(match.group('hour')), int(match.group('minute') or 0), int(match.group('second') or 0),
+            int(fraction[:6].ljust(6, '0')), _parse_offset(match.group('offset'))))
+    except ValueError:
+        return None
+
+
+def _date_from_match(match: 're.Match') -> datetime.date:
+    year = int(match.group('year'))
+    if match.group('month'):
+        return datetime.date(year, int(match.group('month')), int(match.group('day')))
+    if match.group('week'):
+        week, weekday = int(match.group('week')), int(match.group('weekday'))
+        if hasattr(datetime.date, 'fromisocalendar'):
+            return datetime.date.fromisocalendar(year, week, weekday)
+        return datetime.datetime.strptime(f'{year} {week} {weekday}', '%G %V %u').date()
+    ordinal = int(match.group('ordinal'))
+    is_leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    if not 1 <= ordinal <= (366 if is_leap else 365):
+        raise ValueError(f'ordinal {ordinal} is out of range for {year}')
+    return datetime.date(year, 1, 1) + datetime.timedelta(days=ordinal - 1)
+
+
+def _parse_offset(offset: Optional[str]) -> Optional[datetime.tzinfo]:
+    if offset is None:
+        return None
+    if offset in 'Zz':
+        return datetime.timezone.utc
+    sign = -1 if offset[0] == '-' else 1
+    digits = offset[1:].replace(':', '')
+    return datetime.timezone(sign * datetime.timedelta(hours=int(digits[:2]), minutes=int(digits[2:] or 0)))
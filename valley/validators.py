@@ -1,9 +1,10 @@
-import re
 import datetime
-import time
-from typing import Any, List, Dict, Type, Optional
+import itertools
+import os
+from typing import Any, Callable, FrozenSet, Iterable, List, Dict, Type, Optional, Tuple, Union
 
-from valley.exceptions import ValidationException
+from valley.exceptions import ErrorCode, ValidationException
+from valley.utils.dates import parse_date, parse_datetime
 
 
 class Validator:
@@ -11,184 +12,480 @@ class Validator:
     Base class for all validators.
 
     This class provides basic structure and interface for all specific validators.
+
+    Attributes:
+        is_required_regardless (bool): Whether the validator also runs for None values.
+        reorderable (bool): Whether the validator only constrains values that already passed the
+            required and type checks, so that it may run in any order relative to other reorderable validators.
     """
     is_required_regardless: bool = False
-    def validate(self, value: Any, name: str) -> None:
+    reorderable: bool = False
+    # Instances returned by shared(), keyed by class and parameters, for as long as a property uses them;
+    # created by the first call, so that importing valley does not load weakref
+    _shared_instances: Optional['weakref.WeakValueDictionary[tuple, Validator]'] = None
+
+    @classmethod
+    def shared(cls, *args: Any, **kwargs: Any) -> 'Validator':
+        """
+        Returns the validator instance for the given parameters that is shared across properties.
+
+        Validators are not changed after they are created, so properties use this instead of
+        creating their own instances. Validators with unhashable parameters, such as a dict of
+        choices, are not shared.
+
+        Args:
+            *args: The positional arguments of the validator's constructor.
+            **kwargs: The keyword arguments of the validator's constructor.
+
+        Returns:
+            Validator: The shared validator.
+        """
+        # The types are part of the key, so that e.g. 1 and True do not share a validator
+        key = (cls, tuple((type(arg), arg) for arg in args),
+               tuple((name, type(arg), arg) for name, arg in sorted(kwargs.items())))
+        instances = Validator._shared_instances
+        if instances is None:
+            import weakref
+            instances = Validator._shared_instances = weakref.WeakValueDictionary()
+        try:
+            validator = instances.get(key)
+        except TypeError:
+            return cls(*args, **kwargs)
+        if validator is None:
+            validator = instances.setdefault(key, cls(*args, **kwargs))
+        return validator
+
+    def validate(self, value: Any, name: str) -> Any:
         # Ignore None values if the ignore_none flag is True
         if value is None and not self.is_required_regardless:
             return
 
-        self.perform_validation(value, name)
+        # Coroutine validators return an awaitable for BaseProperty.avalidate
+        return self.perform_validation(value, name)
 
     def perform_validation(self, value: Any, name: str) -> None:
         """
-        Method to perform validation, to be implemented by subclasses.
+        Method to perform validation, to be implemented by subclasses that do not implement check().
 
         Args:
             value (Any): The value to validate.
             name (str): The name of the property being validated.
+
+        Raises:
+            ValidationException: If the value is not valid.
+        """
+        error = self.check(value)
+        if error is not None:
+            raise ValidationException(error.message(name))
+
+    def check(self, value: Any) -> Optional[ErrorCode]:
+        """
+        Exception-free validation, to be implemented by subclasses.
+
+        Schemas call this instead of validate() on the hot path. Like perform_validation(),
+        it is only called for None if ``is_required_regardless`` is set.
+
+        Args:
+            value (Any): The value to validate.
+
+        Returns:
+            Optional[ErrorCode]: The error, or None if the value is valid.
         """
         raise NotImplementedError
 
+    def coerce(self, value: Any) -> Tuple[Any, Optional[ErrorCode]]:
+        """
+        Checks the value and parses it into the type the validator checks for, in a single step.
+
+        Validators that parse their input to check it, e.g. with ``int(value)``, override
+        this to return the parsed value instead of discarding it. The default returns the
+        value unchanged along with the result of check().
+
+        Args:
+            value (Any): The value to validate.
+
+        Returns:
+            Tuple[Any, Optional[ErrorCode]]: The parsed value and the error, or None if the value is valid.
+        """
+        return value, self.check(value)
+
+
+def _defining_class(klass: type, name: str) -> type:
+    for base in klass.__mro__:
+        if name in base.__dict__:
+            return base
+    return object
+
+
+def as_check(validator: Validator, name: str) -> Callable[[Any], Optional[ErrorCode]]:
+    """
+    Returns a function that checks values with the validator without raising exceptions.
+
+    Validators whose check() is at least as specific as their perform_validation() and
+    validate() are used directly. Validators that only override perform_validation() or
+    validate() are adapted by catching their ValidationException.
+
+    Args:
+        validator (Validator): The validator.
+        name (str): The name of the property being validated.
+
+    Returns:
+        Callable[[Any], Optional[ErrorCode]]: The check function.
+    """
+    klass = type(validator)
+    check_class = _defining_class(klass, 'check')
+    if check_class is not Validator and issubclass(check_class, _defining_class(klass, 'perform_validation')) \
+            and issubclass(check_class, _defining_class(klass, 'validate')):
+        return validator.check
+
+    validate = validator.perform_validation if klass.validate is Validator.validate else validator.validate
+
+    def check(value: Any) -> Optional[ErrorCode]:
+        try:
+            validate(value, name)
+        except ValidationException as e:
+            return ErrorCode.from_exception(e)
+        return None
+    return check
+
+
+class LazyPattern:
+    """
+    A regular expression class attribute that is compiled once, on first use.
+
+    After the first access the compiled pattern replaces the descriptor on the class,
+    so later lookups are plain attribute lookups. The re module is only imported then,
+    so flags are given inline, e.g. ``(?i)`` for re.IGNORECASE.
+    """
+
+    def __init__(self, pattern: str, flags: int = 0) -> None:
+        self.pattern = pattern
+        self.flags = flags
+        self.name = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> 're.Pattern':
+        import re
+        compiled = re.compile(self.pattern, self.flags)
+        # Replace the descriptor where it is defined, so subclasses share the compiled pattern
+        for klass in owner.__mro__:
+            if klass.__dict__.get(self.name) is self:
+                setattr(klass, self.name, compiled)
+        return compiled
+
+
+# Validator class -> whether its perform_validation() or validate() is a coroutine function
+_coroutine_validator_classes: Dict[type, bool] = {}
+
+
+def _has_coroutine_method(validator: Validator) -> bool:
+    import inspect
+    return inspect.iscoroutinefunction(validator.perform_validation) or inspect.iscoroutinefunction(validator.validate)
+
+
+def is_coroutine_validator(validator: Validator) -> bool:
+    """
+    Returns whether the validator's perform_validation() or validate() is a coroutine function.
+
+    The answer is computed once per validator class, unless the instance overrides either method.
+
+    Args:
+        validator (Validator): The validator.
+
+    Returns:
+        bool: True if the validator has to be awaited.
+    """
+    instance_dict = getattr(validator, '__dict__', {})
+    if 'perform_validation' in instance_dict or 'validate' in instance_dict:
+        return _has_coroutine_method(validator)
+    klass = type(validator)
+    result = _coroutine_validator_classes.get(klass)
+    if result is None:
+        result = _coroutine_validator_classes[klass] = _has_coroutine_method(validator)
+    return result
+
+
+def as_coerce(validator: Validator) -> Optional[Callable[[Any], Tuple[Any, Optional[ErrorCode]]]]:
+    """
+    Returns the validator's coerce() if it parses values, i.e. if it overrides coerce() at least as specifically as check().
+
+    Args:
+        validator (Validator): The validator.
+
+    Returns:
+        Optional[Callable[[Any], Tuple[Any, Optional[ErrorCode]]]]: The coerce function, or None if the
+        validator does not parse values or has a more specific check() than coerce().
+    """
+    klass = type(validator)
+    coerce_class = _defining_class(klass, 'coerce')
+    if coerce_class is Validator or as_check(validator, '') != validator.check \
+            or not issubclass(coerce_class, _defining_class(klass, 'check')):
+        return None
+    return validator.coerce
+
 
 class RequiredValidator(Validator):
     """
     Validator to ensure a value is not None or empty.
     """
     is_required_regardless: bool = True
-    def perform_validation(self, value: Any, name: str) -> None:
+    error = ErrorCode('required', '{name} is required and cannot be empty.')
+
+    def check(self, value: Any) -> Optional[ErrorCode]:
         if value is None or value == '':
-            raise ValidationException(f'{name} is required and cannot be empty.')
+            return self.error
 
 
 class StringValidator(Validator):
     """
     Validator to ensure a value is a string.
     """
+    error = ErrorCode('string', '{name} must be a string.')
 
-    def perform_validation(self, value: Any, name: str) -> None:
+    def check(self, value: Any) -> Optional[ErrorCode]:
         if not isinstance(value, str):
-            raise ValidationException(f'{name} must be a string.')
+            return self.error
 
 
 class IntegerValidator(Validator):
     """
     Validator to ensure a value is an integer.
     """
+    error = ErrorCode('integer', '{name} must be an integer.')
 
-    def perform_validation(self, value: Any, name: str) -> None:
+    def check(self, value: Any) -> Optional[ErrorCode]:
         if isinstance(value, float):
-            raise ValidationException(f'{name} must be an integer.')
+            return self.error
         try:
             int(value)
         except ValueError:
-            raise ValidationException(f'{name} must be an integer.')
+            return self.error
 
+    def coerce(self, value: Any) -> Tuple[Any, Optional[ErrorCode]]:
+        if isinstance(value, int):
+            return value, None
+        if isinstance(value, float):
+            return value, self.error
+        try:
+            return int(value), None
+        except ValueError:
+            return value, self.error
 
 
 class MaxValueValidator(Validator):
     """
     Validator to ensure a value does not exceed a maximum.
     """
+    reorderable: bool = True
 
     def __init__(self, max_value: int) -> None:
         self.max_value = max_value
+        self.error = ErrorCode('max_value', '{name} must not be greater than {max_value}.', max_value=max_value)
 
-    def perform_validation(self, value: int, name: str) -> None:
+    def check(self, value: int) -> Optional[ErrorCode]:
         if value > self.max_value:
-            raise ValidationException(f'{name} must not be greater than {self.max_value}.')
+            return self.error
 
 
 class MinValueValidator(Validator):
     """
     Validator to ensure a value is not below a minimum.
     """
+    reorderable: bool = True
 
     def __init__(self, min_value: int) -> None:
         self.min_value = min_value
+        self.error = ErrorCode('min_value', '{name} must not be less than {min_value}.', min_value=min_value)
 
-    def perform_validation(self, value: int, name: str) -> None:
+    def check(self, value: int) -> Optional[ErrorCode]:
         if value < self.min_value:
-            raise ValidationException(f'{name} must not be less than {self.min_value}.')
+            return self.error
 
 
 class MinLengthValidator(Validator):
     """
     Validator to ensure the length of a value is not below a minimum.
     """
+    reorderable: bool = True
 
     def __init__(self, min_length: int) -> None:
         self.min_length = min_length
+        self.error = ErrorCode('min_length', '{name} must not be shorter than {min_length} characters.', min_length=min_length)
 
-    def perform_validation(self, value: str, name: str) -> None:
+    def check(self, value: str) -> Optional[ErrorCode]:
         if len(value) < self.min_length:
-            raise ValidationException(f'{name} must not be shorter than {self.min_length} characters.')
+            return self.error
 
 
 class MaxLengthValidator(Validator):
     """
     Validator to ensure the length of a value does not exceed a maximum.
     """
+    reorderable: bool = True
 
     def __init__(self, max_length: int) -> None:
         self.max_length = max_length
+        self.error = ErrorCode('max_length', '{name} must not be longer than {max_length} characters.', max_length=max_length)
 
-    def perform_validation(self, value: str, name: str) -> None:
+    def check(self, value: str) -> Optional[ErrorCode]:
         if len(value) > self.max_length:
-            raise ValidationException(f'{name} must not be longer than {self.max_length} characters.')
+            return self.error
 
 
 class DateValidator(Validator):
+    """
+    Validator to ensure a value is a date or an ISO-8601 date string.
+    """
+    error = ErrorCode('date', '{name}: This value should be a valid date object.')
 
-    def perform_validation(self, value, key=None):
+    def check(self, value: Any) -> Optional[ErrorCode]:
         if not value:
             return
-        if value and isinstance(value, str):
-            try:
-                value = datetime.date(*time.strptime(value, '%Y-%m-%d')[:3])
-            except ValueError:
-                pass
-        if value and not isinstance(value, datetime.date):
-            raise ValidationException(
-                '{0}: This value should be a valid date object.'.format(key))
+        if isinstance(value, str):
+            return None if parse_date(value) is not None else self.error
+        if not isinstance(value, datetime.date):
+            return self.error
+
+    def coerce(self, value: Any) -> Tuple[Any, Optional[ErrorCode]]:
+        if isinstance(value, str) and value:
+            parsed = parse_date(value)
+            return (value, self.error) if parsed is None else (parsed, None)
+        return value, self.check(value)
 
 
 class DateTimeValidator(Validator):
+    """
+    Validator to ensure a value is a datetime or an ISO-8601 date and time string.
+    """
+    error = ErrorCode('datetime', '{name}: This value should be a valid datetime object.')
 
-    def perform_validation(self, value, key=None):
+    def check(self, value: Any) -> Optional[ErrorCode]:
         if not value:
             return
-        if value and isinstance(value, str):
-            try:
-                value = value.split('.', 1)[0]  # strip out microseconds
-                value = value[0:19]  # remove timezone
-                value = datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S')
-            except (IndexError, KeyError, ValueError):
-                pass
-        if value and not isinstance(value, datetime.datetime):
-            raise ValidationException(
-                '{0}: This value should be a valid datetime object.'.format(key))
+        if isinstance(value, str):
+            return None if parse_datetime(value) is not None else self.error
+        if not isinstance(value, datetime.datetime):
+            return self.error
+
+    def coerce(self, value: Any) -> Tuple[Any, Optional[ErrorCode]]:
+        if isinstance(value, str) and value:
+            parsed = parse_datetime(value)
+            return (value, self.error) if parsed is None else (parsed, None)
+        return value, self.check(value)
+
+
 class BooleanValidator(Validator):
     """
     Validator to ensure a value is a boolean.
     """
+    error = ErrorCode('boolean', '{name} must be a boolean.')
 
-    def perform_validation(self, value: bool, name: str) -> None:
+    def check(self, value: bool) -> Optional[ErrorCode]:
         if not isinstance(value, bool):
-            raise ValidationException(f'{name} must be a boolean.')
+            return self.error
 
 
 class ChoiceValidator(Validator):
     """
     Validator to ensure a value is within a set of choices.
+
+    The choices are indexed into a frozenset, so checking a value takes constant time
+    regardless of the number of choices; only unhashable values and choices are compared
+    one by one. Choices given as a callable or a file path are loaded and indexed on the
+    first check.
+
+    Attributes:
+        choices: The choices as given, i.e. a dictionary whose values are the choices, an iterable of
+            choices, a callable returning either, or the path to a JSON file holding either or a text
+            file with one choice per line.
     """
-    choices: dict
-    def __init__(self, choices: Dict[str, Any]) -> None:
-        self.choices = choices
+    reorderable: bool = True
+    # The number of choices listed in the error message
+    max_rendered_choices: int = 10
+    choices: Union[Dict[str, Any], Iterable[Any], Callable[[], Any], str, os.PathLike]
 
-    def perform_validation(self, value: Any, name: str) -> None:
-        if value not in self.choices.values():
-            raise ValidationException(f'{name} must be one of {self.choices}.')
+    def __init__(self, choices: Union[Dict[str, Any], Iterable[Any], Callable[[], Any], str, os.PathLike]) -> None:
+        self.choices = choices
+        self._index: Optional[FrozenSet[Any]] = None
+        self._unhashable: Tuple[Any, ...] = ()
+        self.error: Optional[ErrorCode] = None
+        if not callable(choices) and not isinstance(choices, (str, os.PathLike)):
+            self._build_index(choices)
+
+    def _build_index(self, choices: Any) -> None:
+        if isinstance(choices, dict):
+            choices = choices.values()
+        hashable = []
+        unhashable = []
+        for choice in choices:
+            try:
+                hash(choice)
+            except TypeError:
+                unhashable.append(choice)
+            else:
+                hashable.append(choice)
+        rendered = ', '.join(repr(choice) for choice in itertools.islice(itertools.chain(hashable, unhashable),
+                                                                       self.max_rendered_choices))
+        remaining = len(hashable) + len(unhashable) - self.max_rendered_choices
+        if remaining > 0:
+            rendered += f' and {remaining} more'
+        self._unhashable = tuple(unhashable)
+        self.error = ErrorCode('choice', '{name} must be one of {choices}.', choices=rendered)
+        self._index = frozenset(hashable)
+
+    def load_choices(self) -> None:
+        """
+        Loads the choices from the callable or file they were given as and indexes them.
+        """
+        choices = self.choices
+        if callable(choices):
+            choices = choices()
+        elif isinstance(choices, (str, os.PathLike)):
+            with open(choices, encoding='utf-8') as f:
+                if os.fspath(choices).endswith('.json'):
+                    import json
+                    choices = json.load(f)
+                else:
+                    choices = [line.strip() for line in f if line.strip()]
+        self._build_index(choices)
+
+    def check(self, value: Any) -> Optional[ErrorCode]:
+        index = self._index
+        if index is None:
+            self.load_choices()
+            index = self._index
+        try:
+            if value in index:
+                return None
+        except TypeError:
+            pass
+        if self._unhashable and value in self._unhashable:
+            return None
+        return self.error
 
 
 class DictValidator(Validator):
     """
     Validator to ensure a value is a dictionary.
     """
+    error = ErrorCode('dict', '{name} must be a dictionary.')
 
-    def perform_validation(self, value: Dict[Any, Any], name: str) -> None:
+    def check(self, value: Dict[Any, Any]) -> Optional[ErrorCode]:
         if not isinstance(value, dict):
-            raise ValidationException(f'{name} must be a dictionary.')
+            return self.error
 
 
 class ListValidator(Validator):
     """
     Validator to ensure a value is a list.
     """
+    error = ErrorCode('list', '{name} must be a list.')
 
-    def perform_validation(self, value: List[Any], name: str) -> None:
+    def check(self, value: List[Any]) -> Optional[ErrorCode]:
         if not isinstance(value, list):
-            raise ValidationException(f'{name} must be a list.')
+            return self.error
 
 
 class ForeignValidator(Validator):
@@ -198,10 +495,12 @@ class ForeignValidator(Validator):
 
     def __init__(self, foreign_class: Any) -> None:
         self.foreign_class = foreign_class
+        self.error = ErrorCode('foreign', '{name} must be an instance of {foreign_class}.',
+                               foreign_class=foreign_class.__name__)
 
-    def perform_validation(self, value: Any, name: str) -> None:
+    def check(self, value: Any) -> Optional[ErrorCode]:
         if not isinstance(value, self.foreign_class):
-            raise ValidationException(f'{name} must be an instance of {self.foreign_class.__name__}.')
+            return self.error
 
 
 class MultiValidator(Validator):
@@ -221,71 +520,88 @@ class FloatValidator(Validator):
     """
     Validator to ensure a value is a float.
     """
+    error = ErrorCode('float', '{name} must be a float.')
 
-    def perform_validation(self, value: Any, name: str) -> None:
+    def check(self, value: Any) -> Optional[ErrorCode]:
         """
-        Validates that the given value is a float.
+        Checks that the given value is a float.
 
         Args:
             value (Any): The value to validate.
-            name (str): The name of the property being validated.
 
-        Raises:
-            ValidationException: If the value is not a float.
+        Returns:
+            Optional[ErrorCode]: The error if the value is not a float.
         """
         try:
             float(value)
         except ValueError:
-            raise ValidationException(f'{name} must be a float.')
+            return self.error
+
+    def coerce(self, value: Any) -> Tuple[Any, Optional[ErrorCode]]:
+        """
+        Checks that the given value is a float and converts it to one.
+
+        Args:
+            value (Any): The value to validate.
+
+        Returns:
+            Tuple[Any, Optional[ErrorCode]]: The float and None, or the value and the error if it is not a float.
+        """
+        if isinstance(value, float):
+            return value, None
+        try:
+            return float(value), None
+        except ValueError:
+            return value, self.error
 
 
 class SlugValidator(Validator):
     """
     Validator to ensure a value is a valid slug.
     """
+    reorderable: bool = True
+    error = ErrorCode('slug', '{name} must be a valid slug (only letters, numbers, hyphens, and underscores).')
 
-    def __init__(self):
-        self.slug_pattern = re.compile(r'^[-a-zA-Z0-9_]+$')
+    slug_pattern = LazyPattern(r'^[-a-zA-Z0-9_]+$')
 
-    def perform_validation(self, value: str, name: str) -> None:
+    def check(self, value: str) -> Optional[ErrorCode]:
         """
-        Validates that the given value is a valid slug.
+        Checks that the given value is a valid slug.
 
         Args:
             value (str): The value to validate.
-            name (str): The name of the property being validated.
 
-        Raises:
-            ValidationException: If the value is not a valid slug.
+        Returns:
+            Optional[ErrorCode]: The error if the value is not a valid slug.
         """
         if not isinstance(value, str) or not self.slug_pattern.match(value):
-            raise ValidationException(f'{name} must be a valid slug (only letters, numbers, hyphens, and underscores).')
+            return self.error
 
 
 class EmailValidator(Validator):
     """
     Validator to ensure a value is a valid email address.
     """
+    reorderable: bool = True
+    error = ErrorCode('email', '{name} must be a valid email address.')
 
-    def __init__(self):
-        self.email_pattern = re.compile(
-    r"(^[-!#$%&'*+/=?^_`{}|~0-9A-Z]+(\.[-!#$%&'*+/=?^_`{}|~0-9A-Z]+)*"  # dot-atom
-    r'|^"([\001-\010\013\014\016-\037!#-\[\]-\177]|\\[\001-011\013\014\016-\177])*"' # quoted-string
-    r')@(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?$', re.IGNORECASE)  # domain
+    email_pattern = LazyPattern(
+        r"(?i)(^[-!#$%&'*+/=?^_`{}|~0-9A-Z]+(\.[-!#$%&'*+/=?^_`{}|~0-9A-Z]+)*"  # dot-atom
+        r'|^"([\001-\010\013\014\016-\037!#-\[\]-\177]|\\[\001-011\013\014\016-\177])*"'  # quoted-string
+        r')@(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?$')  # domain
 
-    def perform_validation(self, value: str, name: str) -> None:
+    def check(self, value: str) -> Optional[ErrorCode]:
         """
-        Validates that the given value is a valid email address.
+        Checks that the given value is a valid email address.
 
         Args:
             value (str): The value to validate.
-            name (str): The name of the property being validated.
 
-        Raises:
-            ValidationException: If the value is not a valid email address.
+        Returns:
+            Optional[ErrorCode]: The error if the value is not a valid email address.
         """
         if not isinstance(value, str) or not self.email_pattern.match(value):
-            raise ValidationException(f'{name} must be a valid email address.')
+            return self.error
 
 class ForeignListValidator(Validator):
     """
@@ -300,20 +616,21 @@ class ForeignListValidator(Validator):
             foreign_class (Type[Any]): The class that all list items should be instances of.
         """
         self.foreign_class = foreign_class
+        self.error = ErrorCode('foreign_list', 'All items in {name} must be instances of {foreign_class}.',
+                               foreign_class=foreign_class.__name__)
 
-    def perform_validation(self, value: List[Any], name: str) -> None:
+    def check(self, value: List[Any]) -> Optional[ErrorCode]:
         """
-        Validates that all items in the list are instances of the specified class.
+        Checks that all items in the list are instances of the specified class.
 
         Args:
             value (List[Any]): The list to validate.
-            name (str): The name of the property being validated.
 
-        Raises:
-            ValidationException: If any item in the list is not an instance of the specified class.
+        Returns:
+            Optional[ErrorCode]: The error if any item in the list is not an instance of the specified class.
         """
         if not all(isinstance(item, self.foreign_class) for item in value):
-            raise ValidationException(f'All items in {name} must be instances of {self.foreign_class.__name__}.')
+            return self.error
 
 
 